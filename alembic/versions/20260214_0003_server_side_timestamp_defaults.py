@@ -0,0 +1,54 @@
+"""move timestamp defaults to the database server
+
+Revision ID: 20260214_0003
+Revises: 20260213_0002
+Create Date: 2026-02-14 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260214_0003"
+down_revision = "20260213_0002"
+branch_labels = None
+depends_on = None
+
+
+_TIMESTAMP_COLUMNS = {
+    "content_plans": ("created_at", "updated_at"),
+    "brief_assets": ("created_at", "updated_at"),
+    "publish_attempts": ("attempted_at", "created_at"),
+    "post_performance_snapshots": ("captured_at", "created_at"),
+    "experiment_arm_states": ("created_at", "updated_at"),
+    "niche_candidates": ("created_at",),
+    "niche_scores": ("created_at",),
+    "account_experiments": ("created_at",),
+    "experiment_posts": ("created_at",),
+    "experiment_metrics": ("captured_at",),
+    "model_versions": ("created_at",),
+}
+
+
+def upgrade() -> None:
+    for table_name, columns in _TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for column_name in columns:
+                batch_op.alter_column(
+                    column_name,
+                    existing_type=sa.DateTime(timezone=True),
+                    existing_nullable=False,
+                    server_default=sa.func.now(),
+                )
+
+
+def downgrade() -> None:
+    for table_name, columns in _TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for column_name in columns:
+                batch_op.alter_column(
+                    column_name,
+                    existing_type=sa.DateTime(timezone=True),
+                    existing_nullable=False,
+                    server_default=None,
+                )
@@ -0,0 +1,34 @@
+"""add composite indexes for repository query paths
+
+Revision ID: 20260215_0004
+Revises: 20260214_0003
+Create Date: 2026-02-15 00:00:00
+"""
+
+from alembic import op
+
+
+revision = "20260215_0004"
+down_revision = "20260214_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_publish_attempts_status_attempted_at",
+        "publish_attempts",
+        ["status", "attempted_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_post_performance_snapshots_window_captured_at",
+        "post_performance_snapshots",
+        ["window", "captured_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_post_performance_snapshots_window_captured_at", table_name="post_performance_snapshots")
+    op.drop_index("ix_publish_attempts_status_attempted_at", table_name="publish_attempts")
@@ -0,0 +1,38 @@
+"""add BRIN indexes on append-only time columns
+
+Revision ID: 20260216_0005
+Revises: 20260215_0004
+Create Date: 2026-02-16 00:00:00
+"""
+
+from alembic import op
+
+
+revision = "20260216_0005"
+down_revision = "20260215_0004"
+branch_labels = None
+depends_on = None
+
+
+_BRIN_INDEXES = (
+    ("brin_post_performance_snapshots_captured_at", "post_performance_snapshots", "captured_at"),
+    ("brin_experiment_metrics_captured_at", "experiment_metrics", "captured_at"),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        return
+    for index_name, table_name, column_name in _BRIN_INDEXES:
+        op.create_index(index_name, table_name, [column_name], unique=False, postgresql_using="brin")
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    for index_name, table_name, _ in reversed(_BRIN_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -421,18 +421,21 @@ class PipelineWorker:
                     run.current_stage = "trends"
                     from instagram_ai_system.storage import TrendIngestionRepository
 
-                    repo = TrendIngestionRepository(session)
-                    for idx, item in enumerate(items):
-                        repo.create(
-                            ingestion_id=f"{run_id}:trend:{idx}",
-                            run_id=run_id,
-                            source=item.source,
-                            topic=item.keyword,
-                            score=item.score,
-                            momentum=item.momentum,
-                            payload=item.__dict__,
-                            observed_at=datetime.fromisoformat(item.observed_at.replace("Z", "+00:00")),
-                        )
+                    TrendIngestionRepository(session).create_many(
+                        [
+                            {
+                                "id": f"{run_id}:trend:{idx}",
+                                "run_id": run_id,
+                                "source": item.source,
+                                "topic": item.keyword,
+                                "score": item.score,
+                                "momentum": item.momentum,
+                                "payload": item.__dict__,
+                                "observed_at": datetime.fromisoformat(item.observed_at.replace("Z", "+00:00")),
+                            }
+                            for idx, item in enumerate(items)
+                        ]
+                    )
                     self._checkpoint(run_id, "trends", "done", payload)
                     return payload
                 except Exception as exc:
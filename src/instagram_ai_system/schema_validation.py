@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib.parse import urlparse
 
 
@@ -21,12 +22,22 @@ def load_schema(schema_path: str) -> dict[str, Any]:
         return json.load(handle)
 
 
-def validate_payload(payload: Any, schema_path: str) -> None:
+@lru_cache(maxsize=None)
+def compile_validator(schema_path: str) -> Callable[[Any], None]:
+    """Load ``schema_path`` once and return a validator bound to the parsed schema."""
     schema = load_schema(schema_path)
-    errors: list[str] = []
-    _validate_node(payload, schema, "$", errors)
-    if errors:
-        raise SchemaValidationError(f"Schema validation failed for {schema_path}: {'; '.join(errors)}")
+
+    def validate(payload: Any) -> None:
+        errors: list[str] = []
+        _validate_node(payload, schema, "$", errors)
+        if errors:
+            raise SchemaValidationError(f"Schema validation failed for {schema_path}: {'; '.join(errors)}")
+
+    return validate
+
+
+def validate_payload(payload: Any, schema_path: str) -> None:
+    compile_validator(schema_path)(payload)
 
 
 def _validate_node(value: Any, schema: dict[str, Any], path: str, errors: list[str]) -> None:
@@ -7,6 +7,16 @@ from .contracts_envelope import coerce_to_envelope, extract_payload
 from .schema_validation import validate_payload
 
 _DURATION_BUCKETS = {15: (12, 18), 30: (24, 36), 45: (36, 54)}
+_HASHTAGS: tuple[str, ...] = (
+    "#instagramreels",
+    "#contentstrategy",
+    "#creatorgrowth",
+    "#socialmediatips",
+    "#reelstips",
+)
+_ON_SCREEN_HOOK = "You are doing this wrong"
+_ON_SCREEN_BODY = "Step 1, Step 2, Step 3"
+_ON_SCREEN_CTA = "Save and share for later"
 
 
 @dataclass(slots=True)
@@ -42,34 +52,28 @@ class ScriptGenerationService:
                     "start_second": 0,
                     "end_second": hook_seconds,
                     "voiceover": idea["hook_options"][0],
-                    "on_screen_text": "You are doing this wrong",
+                    "on_screen_text": _ON_SCREEN_HOOK,
                 },
                 {
                     "segment_type": "body",
                     "start_second": hook_seconds,
                     "end_second": hook_seconds + body_seconds,
                     "voiceover": idea["premise"],
-                    "on_screen_text": "Step 1, Step 2, Step 3",
+                    "on_screen_text": _ON_SCREEN_BODY,
                 },
                 {
                     "segment_type": "cta",
                     "start_second": hook_seconds + body_seconds,
                     "end_second": hook_seconds + body_seconds + cta_seconds,
                     "voiceover": request.cta_preference,
-                    "on_screen_text": "Save and share for later",
+                    "on_screen_text": _ON_SCREEN_CTA,
                 },
             ],
             "caption_variants": {
                 "short": f"{idea['title']}. Save this for your next sprint.",
                 "long": f"{idea['premise']}\n\nTone: {request.tone}.\nCTA: {request.cta_preference}",
             },
-            "hashtags": [
-                "#instagramreels",
-                "#contentstrategy",
-                "#creatorgrowth",
-                "#socialmediatips",
-                "#reelstips",
-            ],
+            "hashtags": list(_HASHTAGS),
         }
         min_duration, max_duration = _DURATION_BUCKETS[request.duration_seconds]
         if not (min_duration <= payload["estimated_total_duration_seconds"] <= max_duration):
@@ -1,31 +1,54 @@
-from .database import Database
-from .models import Base
-from .repositories import (
-    ArmStateRecord,
-    BriefAssetRepository,
-    ContentPlanRepository,
-    ExperimentStateRepository,
-    NicheStrategyRepository,
-    PerformanceSnapshotRepository,
-    PublishAttemptRepository,
-    OperationRunRepository,
-    TrendIngestionRepository,
-    DecisionLogRepository,
-    MonetizationInsightRepository,
-)
-
-__all__ = [
-    "ArmStateRecord",
-    "Base",
-    "BriefAssetRepository",
-    "ContentPlanRepository",
-    "Database",
-    "ExperimentStateRepository",
-    "NicheStrategyRepository",
-    "PerformanceSnapshotRepository",
-    "PublishAttemptRepository",
-    "OperationRunRepository",
-    "TrendIngestionRepository",
-    "DecisionLogRepository",
-    "MonetizationInsightRepository",
-]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .database import Database
+    from .models import Base
+    from .repositories import (
+        ArmStateRecord,
+        BriefAssetRepository,
+        ContentPlanRepository,
+        DecisionLogRepository,
+        ExperimentStateRepository,
+        MonetizationInsightRepository,
+        NicheStrategyRepository,
+        OperationRunRepository,
+        PerformanceSnapshotRepository,
+        PublishAttemptRepository,
+        TrendIngestionRepository,
+    )
+
+# Resolved on first attribute access so importing the package does not pull in
+# the SQLAlchemy ORM machinery until a storage symbol is actually used.
+_EXPORTS = {
+    "ArmStateRecord": ".repositories",
+    "Base": ".models",
+    "BriefAssetRepository": ".repositories",
+    "ContentPlanRepository": ".repositories",
+    "Database": ".database",
+    "ExperimentStateRepository": ".repositories",
+    "NicheStrategyRepository": ".repositories",
+    "PerformanceSnapshotRepository": ".repositories",
+    "PublishAttemptRepository": ".repositories",
+    "OperationRunRepository": ".repositories",
+    "TrendIngestionRepository": ".repositories",
+    "DecisionLogRepository": ".repositories",
+    "MonetizationInsightRepository": ".repositories",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,12 +3,14 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, Float, Integer, String, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import JSON, DateTime, Float, Index, Integer, String, Text, bindparam, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
 class Base(DeclarativeBase):
-    pass
+    # Timestamps are generated server-side; fetch them back in the same round-trip
+    # so detached instances (expire_on_commit=False) still expose them.
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class ContentPlanModel(Base):
@@ -21,9 +23,9 @@ class ContentPlanModel(Base):
     objective: Mapped[str] = mapped_column(String(64), nullable=False)
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="draft")
     plan_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -39,14 +41,21 @@ class BriefAssetModel(Base):
     lifecycle_state: Mapped[str] = mapped_column(String(32), nullable=False, default="draft")
     approval_status: Mapped[str] = mapped_column(String(32), nullable=False, default="pending")
     approval_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+    # Read-only traversal helpers; the schema has no FK constraints between these tables.
+    publish_attempts: Mapped[list[PublishAttemptModel]] = relationship(
+        primaryjoin="BriefAssetModel.id == foreign(PublishAttemptModel.brief_asset_id)",
+        viewonly=True,
     )
 
 
 class PublishAttemptModel(Base):
     __tablename__ = "publish_attempts"
+    __table_args__ = (Index("ix_publish_attempts_status_attempted_at", "status", "attempted_at"),)
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     schema_version: Mapped[str] = mapped_column(String(16), nullable=False, default="1.0")
@@ -57,12 +66,23 @@ class PublishAttemptModel(Base):
     attempt_number: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     response_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    attempted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    attempted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    snapshots: Mapped[list[PerformanceSnapshotModel]] = relationship(
+        primaryjoin="PublishAttemptModel.id == foreign(PerformanceSnapshotModel.publish_attempt_id)",
+        viewonly=True,
+    )
 
 
 class PerformanceSnapshotModel(Base):
     __tablename__ = "post_performance_snapshots"
+    __table_args__ = (
+        Index("ix_post_performance_snapshots_window_captured_at", "window", "captured_at"),
+        Index("brin_post_performance_snapshots_captured_at", "captured_at", postgresql_using="brin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     schema_version: Mapped[str] = mapped_column(String(16), nullable=False, default="1.0")
@@ -71,8 +91,8 @@ class PerformanceSnapshotModel(Base):
     window: Mapped[str] = mapped_column(String(16), nullable=False, default="24h")
     metrics_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     derived_rates: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class ExperimentArmStateModel(Base):
@@ -84,9 +104,9 @@ class ExperimentArmStateModel(Base):
     pulls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     reward_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class NicheCandidateModel(Base):
@@ -99,7 +119,7 @@ class NicheCandidateModel(Base):
     target_audience: Mapped[str] = mapped_column(String(255), nullable=False)
     candidate_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="generated")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class NicheScoreModel(Base):
@@ -112,7 +132,7 @@ class NicheScoreModel(Base):
     score_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     success_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, index=True)
     model_version: Mapped[str] = mapped_column(String(32), nullable=False, default="rules-v1")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class AccountExperimentModel(Base):
@@ -126,7 +146,7 @@ class AccountExperimentModel(Base):
     stage: Mapped[str] = mapped_column(String(32), nullable=False, default="stage_1")
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="planned")
     plan_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class ExperimentPostModel(Base):
@@ -139,18 +159,21 @@ class ExperimentPostModel(Base):
     content_ref: Mapped[str] = mapped_column(String(128), nullable=False)
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="planned")
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class ExperimentMetricModel(Base):
     __tablename__ = "experiment_metrics"
+    __table_args__ = (
+        Index("brin_experiment_metrics_captured_at", "captured_at", postgresql_using="brin").ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     schema_version: Mapped[str] = mapped_column(String(16), nullable=False, default="1.0")
     trace_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     experiment_post_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     metric_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class ModelVersionModel(Base):
@@ -162,11 +185,15 @@ class ModelVersionModel(Base):
     model_name: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     version_tag: Mapped[str] = mapped_column(String(64), nullable=False)
     parameters_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class OperationRunModel(Base):
     __tablename__ = "operation_runs"
+    __table_args__ = (
+        Index("ix_operation_runs_name_status_started_at", "operation_name", "status", "started_at"),
+        Index("brin_operation_runs_started_at", "started_at", postgresql_using="brin").ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     operation_name: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -175,14 +202,29 @@ class OperationRunModel(Base):
     result_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     trace_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
 
+# The JSON key is rendered inline (not as a bind) so queries match the expression index.
+operation_run_failed_run_id = OperationRunModel.params_payload[
+    bindparam(None, "failed_run_id", type_=JSON.JSONIndexType(), literal_execute=True)
+].as_string()
+
+_REPLAYED_RUN_FILTER = (OperationRunModel.operation_name == "replay-failed") & (OperationRunModel.status == "succeeded")
+
+Index(
+    "ix_operation_runs_replayed_failed_run_id",
+    operation_run_failed_run_id,
+    postgresql_where=_REPLAYED_RUN_FILTER,
+    sqlite_where=_REPLAYED_RUN_FILTER,
+)
+
+
 class PipelineRunModel(Base):
     __tablename__ = "pipeline_runs"
 
@@ -197,9 +239,9 @@ class PipelineRunModel(Base):
     metrics_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -212,7 +254,7 @@ class PipelineStageCheckpointModel(Base):
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="started")
     payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -227,7 +269,7 @@ class LearningSnapshotModel(Base):
     perf_1h: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     perf_6h: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     perf_24h: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class TrendIngestionModel(Base):
@@ -240,7 +282,7 @@ class TrendIngestionModel(Base):
     score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     momentum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class DecisionLogModel(Base):
@@ -251,7 +293,7 @@ class DecisionLogModel(Base):
     decision_type: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     decision_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     trace_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class MonetizationInsightModel(Base):
@@ -260,4 +302,4 @@ class MonetizationInsightModel(Base):
     id: Mapped[str] = mapped_column(String(96), primary_key=True)
     run_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     insight_payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, Sequence
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, RowMapping, func, insert, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
 
 from .models import (
     AccountExperimentModel,
@@ -23,8 +24,22 @@ from .models import (
     TrendIngestionModel,
     DecisionLogModel,
     MonetizationInsightModel,
+    operation_run_failed_run_id,
 )
 
+# Rows fetched per round-trip by the iter_* streaming readers (server-side cursor on Postgres).
+_STREAM_BATCH_SIZE = 500
+# Values per IN (...) list for bulk membership lookups; older SQLite builds allow 999 binds.
+_IN_CHUNK_SIZE = 500
+
+
+def _bulk_insert(session: Session, model: type[Any], rows: Sequence[dict[str, Any]]) -> int:
+    """Insert append-only rows keyed by column name in one executemany batch; returns the row count."""
+    if not rows:
+        return 0
+    session.execute(insert(model), list(rows))
+    return len(rows)
+
 
 @dataclass(slots=True)
 class ArmStateRecord:
@@ -35,6 +50,16 @@ class ArmStateRecord:
     trace_id: str
 
 
+def _dialect_insert(session: Session) -> Any:
+    """Return the dialect-specific ``insert`` that supports ON CONFLICT, if any."""
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert
+    if dialect_name == "sqlite":
+        return sqlite.insert
+    return None
+
+
 class ContentPlanRepository:
     def __init__(self, session: Session):
         self.session = session
@@ -50,17 +75,81 @@ class ContentPlanRepository:
         schema_version: str,
         trace_id: str,
     ) -> ContentPlanModel:
-        plan = self.session.get(ContentPlanModel, plan_id)
-        if plan is None:
-            plan = ContentPlanModel(id=plan_id, topic=topic, objective=objective, status=status)
-            self.session.add(plan)
-        plan.topic = topic
-        plan.objective = objective
-        plan.status = status
-        plan.plan_payload = payload
-        plan.schema_version = schema_version
-        plan.trace_id = trace_id
-        return plan
+        return self.upsert_plans(
+            [
+                {
+                    "plan_id": plan_id,
+                    "topic": topic,
+                    "objective": objective,
+                    "status": status,
+                    "payload": payload,
+                    "schema_version": schema_version,
+                    "trace_id": trace_id,
+                }
+            ]
+        )[0]
+
+    def upsert_plans(self, plans: Iterable[dict[str, Any]]) -> list[ContentPlanModel]:
+        """Upsert plans given as ``upsert_plan`` keyword dicts; a repeated ``plan_id`` keeps the last entry."""
+        rows_by_id = {
+            plan["plan_id"]: {
+                "id": plan["plan_id"],
+                "topic": plan["topic"],
+                "objective": plan["objective"],
+                "status": plan["status"],
+                "plan_payload": plan["payload"],
+                "schema_version": plan["schema_version"],
+                "trace_id": plan["trace_id"],
+            }
+            for plan in plans
+        }
+        if not rows_by_id:
+            return []
+        rows = list(rows_by_id.values())
+
+        upsert = _dialect_insert(self.session)
+        if upsert is None:
+            return self._upsert_plans_orm(rows)
+
+        stmt = upsert(ContentPlanModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ContentPlanModel.id],
+            set_={
+                "topic": stmt.excluded.topic,
+                "objective": stmt.excluded.objective,
+                "status": stmt.excluded.status,
+                "plan_payload": stmt.excluded.plan_payload,
+                "schema_version": stmt.excluded.schema_version,
+                "trace_id": stmt.excluded.trace_id,
+                "updated_at": func.now(),
+            },
+        )
+        models = {
+            model.id: model
+            for model in self.session.scalars(
+                stmt.returning(ContentPlanModel),
+                execution_options={"populate_existing": True},
+            )
+        }
+        return [models[row["id"]] for row in rows]
+
+    def _upsert_plans_orm(self, rows: list[dict[str, Any]]) -> list[ContentPlanModel]:
+        existing = {
+            model.id: model
+            for model in self.session.scalars(
+                select(ContentPlanModel).where(ContentPlanModel.id.in_([row["id"] for row in rows]))
+            )
+        }
+        plans: list[ContentPlanModel] = []
+        for row in rows:
+            plan = existing.get(row["id"])
+            if plan is None:
+                plan = ContentPlanModel(id=row["id"])
+                self.session.add(plan)
+            for key, value in row.items():
+                setattr(plan, key, value)
+            plans.append(plan)
+        return plans
 
     def get_plan(self, plan_id: str) -> ContentPlanModel | None:
         return self.session.get(ContentPlanModel, plan_id)
@@ -97,10 +186,27 @@ class BriefAssetRepository:
         self.session.add(model)
         return model
 
+    def create_brief_assets(self, rows: Sequence[dict[str, Any]]) -> int:
+        return _bulk_insert(self.session, BriefAssetModel, rows)
+
     def list_for_plan(self, content_plan_id: str) -> list[BriefAssetModel]:
         stmt = select(BriefAssetModel).where(BriefAssetModel.content_plan_id == content_plan_id)
         return list(self.session.scalars(stmt))
 
+    def list_for_plan_deep(
+        self, content_plan_id: str, *, limit: int | None = None, offset: int = 0
+    ) -> list[BriefAssetModel]:
+        """Load a plan's assets with their publish attempts and snapshots in three queries."""
+        stmt = (
+            select(BriefAssetModel)
+            .where(BriefAssetModel.content_plan_id == content_plan_id)
+            .order_by(BriefAssetModel.id)
+            .offset(offset)
+            .limit(limit)
+            .options(selectinload(BriefAssetModel.publish_attempts).selectinload(PublishAttemptModel.snapshots))
+        )
+        return list(self.session.scalars(stmt))
+
 
 class PublishAttemptRepository:
     def __init__(self, session: Session):
@@ -135,6 +241,9 @@ class PublishAttemptRepository:
         self.session.add(model)
         return model
 
+    def create_attempts(self, rows: Sequence[dict[str, Any]]) -> int:
+        return _bulk_insert(self.session, PublishAttemptModel, rows)
+
     def list_for_asset(self, brief_asset_id: str) -> list[PublishAttemptModel]:
         stmt = select(PublishAttemptModel).where(PublishAttemptModel.brief_asset_id == brief_asset_id)
         return list(self.session.scalars(stmt))
@@ -169,10 +278,50 @@ class PerformanceSnapshotRepository:
         self.session.add(model)
         return model
 
+    def record_snapshots(self, rows: Sequence[dict[str, Any]]) -> int:
+        return _bulk_insert(self.session, PerformanceSnapshotModel, rows)
+
     def list_for_attempt(self, publish_attempt_id: str) -> list[PerformanceSnapshotModel]:
         stmt = select(PerformanceSnapshotModel).where(PerformanceSnapshotModel.publish_attempt_id == publish_attempt_id)
         return list(self.session.scalars(stmt))
 
+    def list_for_attempt_projected(
+        self, publish_attempt_id: str, fields: Sequence[str]
+    ) -> Sequence[RowMapping]:
+        """Return only ``fields`` of an attempt's snapshots as read-only mappings, without ORM hydration."""
+        columns = [getattr(PerformanceSnapshotModel, field) for field in fields]
+        stmt = select(*columns).where(PerformanceSnapshotModel.publish_attempt_id == publish_attempt_id)
+        return self.session.execute(stmt).mappings().all()
+
+    def aggregate_by_attempt(
+        self, *, since: datetime, window: str | None = None, platform: str | None = None
+    ) -> Sequence[Row[Any]]:
+        """Sum snapshot metrics per publish attempt in SQL.
+
+        Each row is ``(publish_attempt_id, reach, shares, saves, watch_through_sum, samples)``;
+        ``reach`` falls back to ``views`` and ``watch_through`` to ``retention`` when absent.
+        """
+        payload = PerformanceSnapshotModel.metrics_payload
+        stmt = (
+            select(
+                PerformanceSnapshotModel.publish_attempt_id,
+                func.sum(func.coalesce(payload["reach"].as_float(), payload["views"].as_float(), 0)),
+                func.sum(func.coalesce(payload["shares"].as_float(), 0)),
+                func.sum(func.coalesce(payload["saves"].as_float(), 0)),
+                func.sum(func.coalesce(payload["watch_through"].as_float(), payload["retention"].as_float(), 0.0)),
+                func.count(),
+            )
+            .where(PerformanceSnapshotModel.captured_at >= since)
+            .group_by(PerformanceSnapshotModel.publish_attempt_id)
+        )
+        if window:
+            stmt = stmt.where(PerformanceSnapshotModel.window == window)
+        if platform:
+            stmt = stmt.join(
+                PublishAttemptModel,
+                PublishAttemptModel.id == PerformanceSnapshotModel.publish_attempt_id,
+            ).where(PublishAttemptModel.platform == platform)
+        return self.session.execute(stmt).all()
 
 
 class OperationRunRepository:
@@ -215,34 +364,72 @@ class OperationRunRepository:
         completed_at: datetime,
         error_message: str | None = None,
     ) -> OperationRunModel:
-        model = self.session.get(OperationRunModel, run_id)
+        # The session does not autoflush; push a run created in this unit of work
+        # so the single UPDATE ... RETURNING below can see it.
+        if self.session.new:
+            self.session.flush()
+        stmt = (
+            update(OperationRunModel)
+            .where(OperationRunModel.id == run_id)
+            .values(
+                status=status,
+                result_payload=result_payload,
+                completed_at=completed_at,
+                error_message=error_message,
+            )
+            .returning(OperationRunModel)
+        )
+        model = self.session.scalars(stmt, execution_options={"populate_existing": True}).one_or_none()
         if model is None:
             raise ValueError(f"Unknown operation run id: {run_id}")
-        model.status = status
-        model.result_payload = result_payload
-        model.completed_at = completed_at
-        model.error_message = error_message
         return model
 
     def list_failed_runs(self, *, operation_name: str, since: datetime) -> list[OperationRunModel]:
+        return list(self.iter_failed_runs(operation_name=operation_name, since=since))
+
+    def iter_failed_runs(
+        self, *, operation_name: str, since: datetime, batch_size: int = _STREAM_BATCH_SIZE
+    ) -> Iterator[OperationRunModel]:
+        """Stream failed runs in batches; consume before the session closes."""
         stmt = (
             select(OperationRunModel)
             .where(OperationRunModel.operation_name == operation_name)
             .where(OperationRunModel.status == "failed")
             .where(OperationRunModel.started_at >= since)
             .order_by(OperationRunModel.started_at.asc())
+            .execution_options(yield_per=batch_size)
         )
-        return list(self.session.scalars(stmt))
+        return iter(self.session.scalars(stmt))
 
     def was_replayed(self, *, failed_run_id: str) -> bool:
-        stmt = select(OperationRunModel).where(
-            OperationRunModel.operation_name == "replay-failed",
-            OperationRunModel.status == "succeeded",
+        stmt = (
+            select(OperationRunModel.id)
+            .where(
+                OperationRunModel.operation_name == "replay-failed",
+                OperationRunModel.status == "succeeded",
+                operation_run_failed_run_id == failed_run_id,
+            )
+            .limit(1)
         )
-        for row in self.session.scalars(stmt):
-            if (row.params_payload or {}).get("failed_run_id") == failed_run_id:
-                return True
-        return False
+        return self.session.scalar(stmt) is not None
+
+    def replayed_failed_run_ids(self, failed_run_ids: Iterable[str]) -> set[str]:
+        """Return the subset of ``failed_run_ids`` that ``was_replayed`` would report, in one query."""
+        ids = list(failed_run_ids)
+        replayed: set[str] = set()
+        # Chunked so very large replay windows stay under driver bind-parameter limits.
+        for start in range(0, len(ids), _IN_CHUNK_SIZE):
+            stmt = select(operation_run_failed_run_id).where(
+                OperationRunModel.operation_name == "replay-failed",
+                OperationRunModel.status == "succeeded",
+                operation_run_failed_run_id.in_(ids[start : start + _IN_CHUNK_SIZE]),
+            )
+            replayed.update(self.session.scalars(stmt))
+        return replayed
+
+    def create_runs(self, rows: Sequence[dict[str, Any]]) -> int:
+        return _bulk_insert(self.session, OperationRunModel, rows)
+
 
 class ExperimentStateRepository:
     def __init__(self, session: Session):
@@ -265,19 +452,16 @@ class ExperimentStateRepository:
             trace_id=trace_id,
         )
 
-    def load_arm_states(self) -> list[ArmStateRecord]:
-        stmt = select(ExperimentArmStateModel)
-        rows = self.session.scalars(stmt)
-        return [
-            ArmStateRecord(
-                arm_key=row.arm_key,
-                pulls=row.pulls,
-                reward_sum=row.reward_sum,
-                schema_version=row.schema_version,
-                trace_id=row.trace_id,
-            )
-            for row in rows
-        ]
+    def load_arm_states(self) -> Sequence[Row[Any]]:
+        """Return arm state rows as named tuples with the ``ArmStateRecord`` attributes, skipping ORM hydration."""
+        stmt = select(
+            ExperimentArmStateModel.arm_key,
+            ExperimentArmStateModel.pulls,
+            ExperimentArmStateModel.reward_sum,
+            ExperimentArmStateModel.schema_version,
+            ExperimentArmStateModel.trace_id,
+        )
+        return self.session.execute(stmt).all()
 
     def upsert_arm_states(
         self,
@@ -286,15 +470,61 @@ class ExperimentStateRepository:
         schema_version: str,
         trace_id: str,
     ) -> None:
-        for state in arm_states:
-            model = self.session.get(ExperimentArmStateModel, state.arm_key)
+        """Upsert arm states in one statement; a repeated ``arm_key`` keeps the last entry."""
+        rows_by_key = {
+            state.arm_key: {
+                "arm_key": state.arm_key,
+                "pulls": state.pulls,
+                "reward_sum": state.reward_sum,
+                "schema_version": schema_version,
+                "trace_id": trace_id,
+            }
+            for state in arm_states
+        }
+        if not rows_by_key:
+            return
+        rows = list(rows_by_key.values())
+
+        upsert = _dialect_insert(self.session)
+        if upsert is None:
+            self._upsert_arm_states_orm(rows)
+            return
+
+        stmt = upsert(ExperimentArmStateModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ExperimentArmStateModel.arm_key],
+            set_={
+                "pulls": stmt.excluded.pulls,
+                "reward_sum": stmt.excluded.reward_sum,
+                "schema_version": stmt.excluded.schema_version,
+                "trace_id": stmt.excluded.trace_id,
+                "updated_at": func.now(),
+            },
+        )
+        # RETURNING + populate_existing keeps already-loaded instances in sync with the upsert.
+        self.session.scalars(
+            stmt.returning(ExperimentArmStateModel),
+            execution_options={"populate_existing": True},
+        ).all()
+
+    def _upsert_arm_states_orm(self, rows: list[dict[str, Any]]) -> None:
+        keys = [row["arm_key"] for row in rows]
+        existing = {
+            model.arm_key: model
+            for model in self.session.scalars(
+                select(ExperimentArmStateModel).where(ExperimentArmStateModel.arm_key.in_(keys))
+            )
+        }
+        for row in rows:
+            model = existing.get(row["arm_key"])
             if model is None:
-                model = ExperimentArmStateModel(arm_key=state.arm_key)
+                model = ExperimentArmStateModel(arm_key=row["arm_key"])
                 self.session.add(model)
-            model.pulls = state.pulls
-            model.reward_sum = state.reward_sum
-            model.schema_version = schema_version
-            model.trace_id = trace_id
+                existing[row["arm_key"]] = model
+            model.pulls = row["pulls"]
+            model.reward_sum = row["reward_sum"]
+            model.schema_version = row["schema_version"]
+            model.trace_id = row["trace_id"]
 
 
 class NicheStrategyRepository:
@@ -416,6 +646,9 @@ class NicheStrategyRepository:
         self.session.add(model)
         return model
 
+    def record_experiment_metrics(self, rows: Sequence[dict[str, Any]]) -> int:
+        return _bulk_insert(self.session, ExperimentMetricModel, rows)
+
     def record_model_version(
         self,
         *,
@@ -437,9 +670,41 @@ class NicheStrategyRepository:
         self.session.add(model)
         return model
 
-    def list_ranked_niches(self) -> list[NicheScoreModel]:
-        stmt = select(NicheScoreModel).order_by(NicheScoreModel.success_score.desc())
-        return list(self.session.scalars(stmt))
+    def list_ranked_niches(self, *, jit_min_rows: int | None = None) -> list[NicheScoreModel]:
+        """Return niche scores best-first.
+
+        With ``jit_min_rows`` set, Postgres JIT is enabled for this sort only when the
+        planner's row estimate for ``niche_scores`` reaches that size; short OLTP-sized
+        reads keep the server default because JIT compilation would cost more than it saves.
+        """
+        if jit_min_rows is None or not self._estimated_niche_rows_at_least(jit_min_rows):
+            return list(self.iter_ranked_niches())
+        # A failed query rolls the savepoint back, which also reverts the SET LOCALs.
+        with self.session.begin_nested():
+            self.session.execute(text("SET LOCAL jit = on"))
+            self.session.execute(text("SET LOCAL jit_above_cost = 0"))
+            ranked = list(self.iter_ranked_niches())
+            self.session.execute(text("SET LOCAL jit TO DEFAULT"))
+            self.session.execute(text("SET LOCAL jit_above_cost TO DEFAULT"))
+        return ranked
+
+    def _estimated_niche_rows_at_least(self, min_rows: int) -> bool:
+        if self.session.get_bind().dialect.name != "postgresql":
+            return False
+        estimate = self.session.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": NicheScoreModel.__tablename__},
+        )
+        return estimate is not None and estimate >= min_rows
+
+    def iter_ranked_niches(self, *, batch_size: int = _STREAM_BATCH_SIZE) -> Iterator[NicheScoreModel]:
+        """Stream niche scores best-first in batches; consume before the session closes."""
+        stmt = (
+            select(NicheScoreModel)
+            .order_by(NicheScoreModel.success_score.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(self.session.scalars(stmt))
 
 
 class TrendIngestionRepository:
@@ -471,6 +736,9 @@ class TrendIngestionRepository:
         self.session.add(model)
         return model
 
+    def create_many(self, rows: Sequence[dict[str, Any]]) -> int:
+        return _bulk_insert(self.session, TrendIngestionModel, rows)
+
 
 class DecisionLogRepository:
     def __init__(self, session: Session):
@@ -487,6 +755,9 @@ class DecisionLogRepository:
         self.session.add(model)
         return model
 
+    def create_many(self, rows: Sequence[dict[str, Any]]) -> int:
+        return _bulk_insert(self.session, DecisionLogModel, rows)
+
 
 class MonetizationInsightRepository:
     def __init__(self, session: Session):
@@ -1,50 +1,64 @@
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_right
 from collections import defaultdict
-from statistics import mean
+from operator import attrgetter
 from typing import Iterable, List
 
 from .models import ReelSignal, TrendInsight
 
+# Lower bounds (seconds) of each duration bucket after the first.
+_DURATION_EDGES = (10, 20, 35)
+_DURATION_LABELS = ("0-9s", "10-19s", "20-34s", "35s+")
+
 
 class TrendIntelligenceEngine:
     """Extract viral patterns from observed reels."""
 
     def extract_top_patterns(self, signals: Iterable[ReelSignal], limit: int = 10) -> List[TrendInsight]:
-        by_hook = defaultdict(list)
-        by_duration = defaultdict(list)
+        # Running [sum, count] per group instead of per-group value lists.
+        by_hook: dict[str, list[float]] = defaultdict(lambda: [0.0, 0])
+        by_duration: dict[str, list[float]] = defaultdict(lambda: [0.0, 0])
+        # Bound once so the per-signal loop skips repeated attribute resolution.
+        score_signal = self._virality_proxy
+        bucket_for = self._duration_bucket
 
         for signal in signals:
-            virality_proxy = self._virality_proxy(signal)
-            by_hook[signal.hook_style].append(virality_proxy)
-            duration_bucket = self._duration_bucket(signal.duration_seconds)
-            by_duration[duration_bucket].append(virality_proxy)
+            virality_proxy = score_signal(signal)
+            hook_totals = by_hook[signal.hook_style]
+            hook_totals[0] += virality_proxy
+            hook_totals[1] += 1
+            duration_totals = by_duration[bucket_for(signal.duration_seconds)]
+            duration_totals[0] += virality_proxy
+            duration_totals[1] += 1
 
         insights: List[TrendInsight] = []
-        for hook_style, values in by_hook.items():
+        for hook_style, (total, count) in by_hook.items():
             insights.append(
                 TrendInsight(
                     pattern=f"hook:{hook_style}",
-                    score=mean(values),
-                    rationale=f"Average virality proxy for hook '{hook_style}' from {len(values)} reels.",
+                    score=total / count,
+                    rationale=f"Average virality proxy for hook '{hook_style}' from {count} reels.",
                 )
             )
 
-        for duration_bucket, values in by_duration.items():
+        for duration_bucket, (total, count) in by_duration.items():
             insights.append(
                 TrendInsight(
                     pattern=f"duration:{duration_bucket}",
-                    score=mean(values),
-                    rationale=f"Average virality proxy for {duration_bucket} duration from {len(values)} reels.",
+                    score=total / count,
+                    rationale=f"Average virality proxy for {duration_bucket} duration from {count} reels.",
                 )
             )
 
-        insights.sort(key=lambda i: i.score, reverse=True)
-        return insights[:limit]
+        # Partial top-k selection; ties keep insertion order, same as a stable sort.
+        return heapq.nlargest(limit, insights, key=attrgetter("score"))
 
     @staticmethod
     def _virality_proxy(signal: ReelSignal) -> float:
-        retention = mean(signal.retention_curve) if signal.retention_curve else 0
+        curve = signal.retention_curve
+        retention = sum(curve) / len(curve) if curve else 0.0
         engagement = signal.shares * 3 + signal.saves * 3 + signal.comments * 2
         novelty = signal.visual_novelty_score * 100
         audio = signal.audio_trend_score * 100
@@ -52,10 +66,4 @@ class TrendIntelligenceEngine:
 
     @staticmethod
     def _duration_bucket(duration_seconds: float) -> str:
-        if duration_seconds < 10:
-            return "0-9s"
-        if duration_seconds < 20:
-            return "10-19s"
-        if duration_seconds < 35:
-            return "20-34s"
-        return "35s+"
+        return _DURATION_LABELS[bisect_right(_DURATION_EDGES, duration_seconds)]
@@ -0,0 +1,26 @@
+"""UTC timestamp helpers shared by the integration adapters."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - optional speedup
+
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+UTC = timezone.utc
+
+
+def to_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is UTC else value.astimezone(UTC)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_utc(value: str) -> datetime:
+    # Paginated sources repeat the same timestamp strings; datetimes are immutable, so share them.
+    return to_utc(_parse_iso(value))
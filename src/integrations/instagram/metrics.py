@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any
+from datetime import datetime
+from typing import Any, Sequence
+
+from .._time import UTC, parse_iso_utc, to_utc
 
 
 @dataclass(slots=True)
@@ -11,57 +13,88 @@ class CanonicalPerformanceSnapshot:
     published_post_id: str
     captured_at: datetime
     window: str
-    metrics: dict[str, float | int]
-    derived_rates: dict[str, float]
+    views: int
+    retention: float
+    likes: int
+    comments: int
+    shares: int
+    saves: int
+    profile_visits: int
+
+    @property
+    def metrics(self) -> dict[str, float | int]:
+        """Canonical camelCase metrics as a new dict on every access.
+
+        Hot readers should use the slotted fields (``views``, ``likes``, ...) directly;
+        writes to the returned dict do not update the snapshot.
+        """
+        return {
+            "views": self.views,
+            "retention": self.retention,
+            "likes": self.likes,
+            "comments": self.comments,
+            "shares": self.shares,
+            "saves": self.saves,
+            "profileVisits": self.profile_visits,
+        }
+
+    @property
+    def derived_rates(self) -> dict[str, float]:
+        """Per-view engagement rates as a new dict on every access; see ``metrics``."""
+        inv_views = 1.0 / max(self.views, 1)
+        return {
+            "likeRate": self.likes * inv_views,
+            "commentRate": self.comments * inv_views,
+            "shareRate": self.shares * inv_views,
+            "saveRate": self.saves * inv_views,
+            "profileVisitRate": self.profile_visits * inv_views,
+        }
 
 
 class InstagramMetricsCollector:
     """Maps Instagram-native insights payloads to canonical performance schema."""
 
     def map_to_canonical(self, post_id: str, native_payload: dict[str, Any], window: str = "24h") -> CanonicalPerformanceSnapshot:
-        views = int(native_payload.get("plays", 0))
-        likes = int(native_payload.get("likes", 0))
-        comments = int(native_payload.get("comments", 0))
-        shares = int(native_payload.get("shares", 0))
-        saves = int(native_payload.get("saved", 0))
-        profile_visits = int(native_payload.get("profile_visits", 0))
-        avg_watch_time = float(native_payload.get("avg_watch_time_seconds", 0.0))
-        video_length = float(native_payload.get("video_length_seconds", 0.0))
-        retention = min(1.0, (avg_watch_time / video_length)) if video_length > 0 else 0.0
-
-        denom = max(views, 1)
-        derived_rates = {
-            "likeRate": likes / denom,
-            "commentRate": comments / denom,
-            "shareRate": shares / denom,
-            "saveRate": saves / denom,
-            "profileVisitRate": profile_visits / denom,
-        }
+        return _to_canonical(post_id, native_payload, window)
+
+    def map_many(
+        self,
+        post_ids: Sequence[str],
+        native_payloads: Sequence[dict[str, Any]],
+        window: str = "24h",
+    ) -> list[CanonicalPerformanceSnapshot]:
+        """Map a batch of insights payloads; ``post_ids[i]`` pairs with ``native_payloads[i]``."""
+        if len(post_ids) != len(native_payloads):
+            raise ValueError("post_ids and native_payloads must have the same length.")
+        return [_to_canonical(post_id, payload, window) for post_id, payload in zip(post_ids, native_payloads)]
+
+
+def _to_canonical(post_id: str, native_payload: dict[str, Any], window: str) -> CanonicalPerformanceSnapshot:
+    avg_watch_time = float(native_payload.get("avg_watch_time_seconds", 0.0))
+    video_length = float(native_payload.get("video_length_seconds", 0.0))
+    retention = min(1.0, (avg_watch_time / video_length)) if video_length > 0 else 0.0
+
+    captured_at = _parse_ts(native_payload.get("captured_at"))
+    snapshot_id = f"{post_id}:{window}:{captured_at.isoformat()}"
 
-        captured_at = _parse_ts(native_payload.get("captured_at"))
-        snapshot_id = f"{post_id}:{window}:{captured_at.isoformat()}"
-
-        return CanonicalPerformanceSnapshot(
-            id=snapshot_id,
-            published_post_id=post_id,
-            captured_at=captured_at,
-            window=window,
-            metrics={
-                "views": views,
-                "retention": retention,
-                "likes": likes,
-                "comments": comments,
-                "shares": shares,
-                "saves": saves,
-                "profileVisits": profile_visits,
-            },
-            derived_rates=derived_rates,
-        )
+    return CanonicalPerformanceSnapshot(
+        id=snapshot_id,
+        published_post_id=post_id,
+        captured_at=captured_at,
+        window=window,
+        views=int(native_payload.get("plays", 0)),
+        retention=retention,
+        likes=int(native_payload.get("likes", 0)),
+        comments=int(native_payload.get("comments", 0)),
+        shares=int(native_payload.get("shares", 0)),
+        saves=int(native_payload.get("saved", 0)),
+        profile_visits=int(native_payload.get("profile_visits", 0)),
+    )
 
 
 def _parse_ts(value: Any) -> datetime:
     if isinstance(value, datetime):
-        return value.astimezone(timezone.utc)
+        return to_utc(value)
     if isinstance(value, str) and value:
-        return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
-    return datetime.now(tz=timezone.utc)
+        return parse_iso_utc(value)
+    return datetime.now(tz=UTC)
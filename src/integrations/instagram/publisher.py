@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 import hashlib
-import json
+import logging
+import queue
+import random
+import struct
+import threading
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
+
+from .._time import UTC, to_utc
+
+logger = logging.getLogger(__name__)
+
+# Pending entries held for the audit sink before new ones are dropped, and entries per sink write.
+_AUDIT_QUEUE_SIZE = 1024
+_AUDIT_BATCH_SIZE = 256
+
+# Big-endian uint32 byte lengths of the four idempotency-key fields.
+_IDEMPOTENCY_LENGTHS = struct.Struct(">4I")
+# Marks keys from the length-prefixed scheme so they never collide with the older JSON-digest keys.
+_IDEMPOTENCY_KEY_VERSION = "v2:"
 
 
 @dataclass(slots=True)
@@ -33,8 +51,54 @@ class PublishResult:
 class AuditEntry:
     event: str
     idempotency_key: str
-    timestamp: datetime
+    timestamp_ns: int
     payload: dict[str, Any]
+    # Per-attempt fields kept apart from the shared request payload instead of copied into it.
+    extra: dict[str, Any] | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        return self.to_datetime()
+
+    def to_datetime(self) -> datetime:
+        """UTC ``datetime`` for the epoch-nanosecond ``timestamp_ns``, built only when read."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=UTC).replace(microsecond=nanos // 1000)
+
+    def merged_payload(self) -> dict[str, Any]:
+        """``payload`` with ``extra`` layered on top, as one dict for serialization."""
+        return {**self.payload, **self.extra} if self.extra else self.payload
+
+
+# Queued by InstagramPublisher.close() to tell the drain thread to exit once earlier entries are written.
+_AUDIT_STOP = object()
+
+
+def _drain_audit(pending: queue.Queue[Any], sink: Callable[[list[AuditEntry]], None]) -> None:
+    stopping = False
+    while not stopping:
+        item = pending.get()
+        taken = 1
+        stopping = item is _AUDIT_STOP
+        batch = [] if stopping else [item]
+        while not stopping and len(batch) < _AUDIT_BATCH_SIZE:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            if item is _AUDIT_STOP:
+                stopping = True
+            else:
+                batch.append(item)
+        try:
+            if batch:
+                sink(batch)
+        except Exception:
+            logger.exception("Audit sink failed to write %d entries", len(batch))
+        finally:
+            for _ in range(taken):
+                pending.task_done()
 
 
 class TransientPublishError(RuntimeError):
@@ -47,6 +111,7 @@ class GovernanceApprovalError(RuntimeError):
 
 class InstagramPublisher:
     REQUIRED_APPROVALS = frozenset({"editorial", "compliance", "rights"})
+    _REQUIRED_APPROVALS_SORTED = tuple(sorted(REQUIRED_APPROVALS))
 
     def __init__(
         self,
@@ -55,22 +120,58 @@ class InstagramPublisher:
         max_retries: int = 3,
         base_backoff_seconds: float = 0.5,
         sleeper: Callable[[float], None] | None = None,
+        dedup_capacity: int = 10_000,
+        max_batch_size: int = 2000,
+        audit_sink: Callable[[list[AuditEntry]], None] | None = None,
+        max_backoff_seconds: float | None = None,
+        backoff_jitter: float = 0.0,
     ) -> None:
         self.client = client
         self.dry_run = dry_run
         self.max_retries = max_retries
         self.base_backoff_seconds = base_backoff_seconds
         self.sleeper = sleeper or time.sleep
-        self._seen_idempotency_keys: set[str] = set()
+        self.backoff_jitter = backoff_jitter
+        # Exponential delays before retry 1..max_retries-1, capped when max_backoff_seconds is set.
+        self._backoff_schedule = tuple(
+            base_backoff_seconds * (1 << step)
+            if max_backoff_seconds is None
+            else min(base_backoff_seconds * (1 << step), max_backoff_seconds)
+            for step in range(max(max_retries - 1, 0))
+        )
+        self.dedup_capacity = dedup_capacity
+        self.max_batch_size = max_batch_size
+        # Exact keys of the most recent publishes, oldest first; bounded so long-running workers don't grow forever.
+        self._seen_idempotency_keys: OrderedDict[str, None] = OrderedDict()
         self.audit_log: list[AuditEntry] = []
+        # Entries bound for an external sink are handed to a drain thread so slow
+        # sink writes stay off the publish path; audit_log itself stays synchronous.
+        self.audit_sink = audit_sink
+        self._audit_queue: queue.Queue[Any] | None = None
+        self._audit_thread: threading.Thread | None = None
+        if audit_sink is not None:
+            self._audit_queue = queue.Queue(maxsize=_AUDIT_QUEUE_SIZE)
+            self._audit_thread = threading.Thread(
+                target=_drain_audit,
+                args=(self._audit_queue, audit_sink),
+                name="instagram-audit-drain",
+                daemon=True,
+            )
+            self._audit_thread.start()
+
+    def __enter__(self) -> InstagramPublisher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def publish(self, request: PublishRequest) -> PublishResult:
         self._enforce_approval_gate(request)
-        key = request.idempotency_key or self._build_idempotency_key(request)
-        payload = self._payload(request, key)
+        key, payload = self._prepare(request)
         self._audit("publish_attempt", key, payload)
 
         if key in self._seen_idempotency_keys:
+            self._seen_idempotency_keys.move_to_end(key)
             result = PublishResult(
                 success=True,
                 status="duplicate_ignored",
@@ -83,7 +184,7 @@ class InstagramPublisher:
             return result
 
         if self.dry_run:
-            self._seen_idempotency_keys.add(key)
+            self._remember_key(key)
             self._audit("publish_dry_run", key, payload)
             return PublishResult(
                 success=True,
@@ -94,14 +195,69 @@ class InstagramPublisher:
                 payload=payload,
             )
 
+        return self._publish_live(key, payload)
+
+    def publish_many(self, requests: Sequence[PublishRequest]) -> list[PublishResult]:
+        """Publish several requests, returning results in input order.
+
+        Approvals are checked for every request before anything is sent. Live posts go
+        out through ``client.publish_post_batch`` in chunks of ``max_batch_size`` when the
+        client offers it, and one ``publish_post`` call at a time otherwise.
+        """
+        for request in requests:
+            self._enforce_approval_gate(request)
+
+        results: dict[int, PublishResult] = {}
+        pending: list[tuple[int, str, dict[str, Any]]] = []
+        pending_keys: set[str] = set()
+        for index, request in enumerate(requests):
+            key, payload = self._prepare(request)
+            # Same per-key audit trail as publish(), so batched posts can be traced by idempotency key.
+            self._audit("publish_attempt", key, payload)
+            if key in self._seen_idempotency_keys:
+                self._seen_idempotency_keys.move_to_end(key)
+                status = "duplicate_ignored"
+                self._audit("publish_duplicate", key, payload)
+            elif key in pending_keys:
+                status = "duplicate_ignored"
+                self._audit("publish_duplicate", key, payload)
+            elif self.dry_run:
+                self._remember_key(key)
+                status = "dry_run"
+                self._audit("publish_dry_run", key, payload)
+            else:
+                pending_keys.add(key)
+                pending.append((index, key, payload))
+                continue
+            results[index] = PublishResult(
+                success=True,
+                status=status,
+                idempotency_key=key,
+                platform_post_id=None,
+                attempts=0,
+                payload=payload,
+            )
+
+        publish_batch = getattr(self.client, "publish_post_batch", None)
+        for start in range(0, len(pending), self.max_batch_size):
+            chunk = pending[start : start + self.max_batch_size]
+            if publish_batch is None:
+                for index, key, payload in chunk:
+                    results[index] = self._publish_live(key, payload)
+                continue
+            for (index, _, _), result in zip(chunk, self._publish_batch_live(publish_batch, chunk)):
+                results[index] = result
+        return [results[index] for index in range(len(requests))]
+
+    def _publish_live(self, key: str, payload: dict[str, Any]) -> PublishResult:
         attempt = 0
         while True:
             attempt += 1
             try:
                 response = self.client.publish_post(payload=payload, idempotency_key=key)
                 platform_post_id = str(response["post_id"])
-                self._seen_idempotency_keys.add(key)
-                self._audit("publish_success", key, {**payload, "post_id": platform_post_id})
+                self._remember_key(key)
+                self._audit("publish_success", key, payload, {"post_id": platform_post_id})
                 return PublishResult(
                     success=True,
                     status="published",
@@ -111,9 +267,10 @@ class InstagramPublisher:
                     payload=payload,
                 )
             except TransientPublishError as exc:
-                self._audit("publish_retry", key, {**payload, "attempt": attempt, "error": str(exc)})
+                failure = {"attempt": attempt, "error": str(exc)}
+                self._audit("publish_retry", key, payload, failure)
                 if attempt >= self.max_retries:
-                    self._audit("publish_failed", key, {**payload, "attempt": attempt, "error": str(exc)})
+                    self._audit("publish_failed", key, payload, failure)
                     return PublishResult(
                         success=False,
                         status="failed",
@@ -122,10 +279,85 @@ class InstagramPublisher:
                         attempts=attempt,
                         payload=payload,
                     )
-                self.sleeper(self.base_backoff_seconds * (2 ** (attempt - 1)))
+                self.sleeper(self._backoff_delay(attempt))
+
+    def _publish_batch_live(
+        self,
+        publish_batch: Callable[..., Sequence[dict[str, Any]]],
+        chunk: list[tuple[int, str, dict[str, Any]]],
+    ) -> list[PublishResult]:
+        keys = [key for _, key, _ in chunk]
+        payloads = [payload for _, _, payload in chunk]
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                responses = publish_batch(payloads=payloads, idempotency_keys=keys)
+            except TransientPublishError as exc:
+                # One failure dict shared by every key's entry, like the shared request payloads.
+                failure = {"attempt": attempt, "error": str(exc)}
+                for key, payload in zip(keys, payloads):
+                    self._audit("publish_retry", key, payload, failure)
+                if attempt >= self.max_retries:
+                    for key, payload in zip(keys, payloads):
+                        self._audit("publish_failed", key, payload, failure)
+                    return [
+                        PublishResult(
+                            success=False,
+                            status="failed",
+                            idempotency_key=key,
+                            platform_post_id=None,
+                            attempts=attempt,
+                            payload=payload,
+                        )
+                        for key, payload in zip(keys, payloads)
+                    ]
+                self.sleeper(self._backoff_delay(attempt))
+                continue
+
+            if len(responses) != len(payloads):
+                # Which posts went out is unknown, so nothing is remembered as published.
+                error = f"publish_post_batch returned {len(responses)} responses for {len(payloads)} payloads"
+                failure = {"attempt": attempt, "error": error}
+                for key, payload in zip(keys, payloads):
+                    self._audit("publish_failed", key, payload, failure)
+                raise RuntimeError(error)
+
+            results: list[PublishResult] = []
+            for key, payload, response in zip(keys, payloads, responses):
+                platform_post_id = str(response["post_id"])
+                self._remember_key(key)
+                self._audit("publish_success", key, payload, {"post_id": platform_post_id})
+                results.append(
+                    PublishResult(
+                        success=True,
+                        status="published",
+                        idempotency_key=key,
+                        platform_post_id=platform_post_id,
+                        attempts=attempt,
+                        payload=payload,
+                    )
+                )
+            return results
+
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = self._backoff_schedule[attempt - 1]
+        if self.backoff_jitter:
+            # Spread retries from concurrent publishers instead of having them retry in lockstep.
+            delay *= 1 + random.random() * self.backoff_jitter
+        return delay
+
+    def _remember_key(self, key: str) -> None:
+        seen = self._seen_idempotency_keys
+        seen[key] = None
+        seen.move_to_end(key)
+        if len(seen) > self.dedup_capacity:
+            seen.popitem(last=False)
 
     def _enforce_approval_gate(self, request: PublishRequest) -> None:
-        missing = sorted([approval for approval in self.REQUIRED_APPROVALS if not request.approvals.get(approval, False)])
+        approvals = request.approvals
+        # Walking the pre-sorted tuple yields missing approvals already in order, with no sort per publish.
+        missing = [approval for approval in self._REQUIRED_APPROVALS_SORTED if not approvals.get(approval, False)]
         if missing:
             payload = {
                 "brief_id": request.brief_id,
@@ -137,35 +369,61 @@ class InstagramPublisher:
                 "Publish blocked by governance gate; missing required approvals: " + ", ".join(missing)
             )
 
-    def _payload(self, request: PublishRequest, idempotency_key: str) -> dict[str, Any]:
+    def _prepare(self, request: PublishRequest) -> tuple[str, dict[str, Any]]:
+        # scheduled_at is normalized and formatted once for both the key and the payload.
+        scheduled_at = to_utc(request.scheduled_at).isoformat() if request.scheduled_at else None
+        key = request.idempotency_key or self._build_idempotency_key(request, scheduled_at)
+        return key, self._payload(request, key, scheduled_at)
+
+    def _payload(self, request: PublishRequest, idempotency_key: str, scheduled_at: str | None) -> dict[str, Any]:
         return {
             "brief_id": request.brief_id,
             "media_url": request.media_url,
             "caption": request.caption,
-            "scheduled_at": request.scheduled_at.astimezone(timezone.utc).isoformat()
-            if request.scheduled_at
-            else None,
+            "scheduled_at": scheduled_at,
             "metadata": request.metadata,
             "idempotency_key": idempotency_key,
         }
 
-    def _build_idempotency_key(self, request: PublishRequest) -> str:
-        basis = {
-            "brief_id": request.brief_id,
-            "media_url": request.media_url,
-            "caption": request.caption,
-            "scheduled_at": request.scheduled_at.astimezone(timezone.utc).isoformat()
-            if request.scheduled_at
-            else None,
-        }
-        return hashlib.sha256(json.dumps(basis, sort_keys=True).encode("utf-8")).hexdigest()
+    def _build_idempotency_key(self, request: PublishRequest, scheduled_at: str | None) -> str:
+        # Fixed four-field schema, each field length-prefixed so no caption or URL
+        # content can shift bytes across a field boundary.
+        fields = [
+            value.encode("utf-8")
+            for value in (request.brief_id, request.media_url, request.caption, scheduled_at or "")
+        ]
+        lengths = _IDEMPOTENCY_LENGTHS.pack(*(len(value) for value in fields))
+        return _IDEMPOTENCY_KEY_VERSION + hashlib.sha256(lengths + b"".join(fields)).hexdigest()
 
-    def _audit(self, event: str, key: str, payload: dict[str, Any]) -> None:
-        self.audit_log.append(
-            AuditEntry(
-                event=event,
-                idempotency_key=key,
-                timestamp=datetime.now(tz=timezone.utc),
-                payload=payload,
-            )
+    def _audit(self, event: str, key: str, payload: dict[str, Any], extra: dict[str, Any] | None = None) -> None:
+        entry = AuditEntry(
+            event=event,
+            idempotency_key=key,
+            timestamp_ns=time.time_ns(),
+            payload=payload,
+            extra=extra,
         )
+        self.audit_log.append(entry)
+        if self._audit_queue is not None:
+            try:
+                self._audit_queue.put_nowait(entry)
+            except queue.Full:
+                logger.warning("Audit sink backlog full; dropped %s entry for %s", event, key)
+
+    def flush_audit(self) -> None:
+        """Block until every queued entry has been handed to the audit sink."""
+        if self._audit_queue is not None:
+            self._audit_queue.join()
+
+    def close(self) -> None:
+        """Write any queued audit entries to the sink and stop the drain thread.
+
+        Later entries are still kept in ``audit_log`` but are no longer forwarded to the sink.
+        """
+        audit_queue, thread = self._audit_queue, self._audit_thread
+        if audit_queue is None or thread is None:
+            return
+        self._audit_queue = None
+        self._audit_thread = None
+        audit_queue.put(_AUDIT_STOP)
+        thread.join()
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import heapq
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
+from operator import attrgetter
 from typing import Any, Iterable, List, Protocol, Sequence
 
+from .._time import UTC, parse_iso_utc, to_utc
+
 
 @dataclass(slots=True)
 class NormalizedTrend:
@@ -15,6 +21,9 @@ class NormalizedTrend:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+_SCORE = attrgetter("score")
+
+
 class TrendSourceAdapter(Protocol):
     source_name: str
 
@@ -35,14 +44,21 @@ class GoogleTrendsAdapter:
         return self.client.fetch_daily_trends()
 
     def normalize(self, payload: dict[str, Any]) -> NormalizedTrend:
-        return NormalizedTrend(
-            topic=str(payload["query"]).strip(),
-            source=self.source_name,
-            score=float(payload.get("interest", 0.0)) / 100.0,
-            momentum=float(payload.get("delta", 0.0)),
-            observed_at=_parse_ts(payload.get("timestamp")),
-            metadata={"geo": payload.get("geo"), "category": payload.get("category")},
-        )
+        return self.normalize_batch((payload,))[0]
+
+    def normalize_batch(self, payloads: Iterable[dict[str, Any]]) -> list[NormalizedTrend]:
+        source, parse_ts, trend, intern = self.source_name, _parse_ts, NormalizedTrend, _intern_label
+        return [
+            trend(
+                topic=str(payload["query"]).strip(),
+                source=source,
+                score=float(payload.get("interest", 0.0)) / 100.0,
+                momentum=float(payload.get("delta", 0.0)),
+                observed_at=parse_ts(payload.get("timestamp")),
+                metadata={"geo": intern(payload.get("geo")), "category": intern(payload.get("category"))},
+            )
+            for payload in payloads
+        ]
 
 
 class RedditTrendsAdapter:
@@ -55,14 +71,21 @@ class RedditTrendsAdapter:
         return self.client.fetch_hot_topics()
 
     def normalize(self, payload: dict[str, Any]) -> NormalizedTrend:
-        return NormalizedTrend(
-            topic=str(payload["title"]).strip(),
-            source=self.source_name,
-            score=float(payload.get("hotness", 0.0)),
-            momentum=float(payload.get("velocity", 0.0)),
-            observed_at=_parse_ts(payload.get("created_utc")),
-            metadata={"subreddit": payload.get("subreddit"), "url": payload.get("url")},
-        )
+        return self.normalize_batch((payload,))[0]
+
+    def normalize_batch(self, payloads: Iterable[dict[str, Any]]) -> list[NormalizedTrend]:
+        source, parse_ts, trend, intern = self.source_name, _parse_ts, NormalizedTrend, _intern_label
+        return [
+            trend(
+                topic=str(payload["title"]).strip(),
+                source=source,
+                score=float(payload.get("hotness", 0.0)),
+                momentum=float(payload.get("velocity", 0.0)),
+                observed_at=parse_ts(payload.get("created_utc")),
+                metadata={"subreddit": intern(payload.get("subreddit")), "url": payload.get("url")},
+            )
+            for payload in payloads
+        ]
 
 
 class InstagramHashtagScraperAdapter:
@@ -100,24 +123,48 @@ class TrendAggregator:
     """Fetches from multiple sources and emits a normalized list sorted by score."""
 
     def __init__(self, adapters: Sequence[TrendSourceAdapter]) -> None:
-        if len(adapters) < 2:
+        self.adapters: tuple[TrendSourceAdapter, ...] = tuple(adapters)
+        if len(self.adapters) < 2:
             raise ValueError("At least two trend sources are required.")
-        self.adapters = adapters
 
-    def fetch_and_normalize(self) -> List[NormalizedTrend]:
-        trends: list[NormalizedTrend] = []
-        for adapter in self.adapters:
-            for row in adapter.fetch():
-                trends.append(adapter.normalize(row))
-        return sorted(trends, key=lambda item: item.score, reverse=True)
+    def fetch_and_normalize(self, top_k: int | None = None) -> List[NormalizedTrend]:
+        """Return normalized trends best-first; with ``top_k``, only the ``top_k`` highest scores."""
+        # Source fetches are network-bound, so run them concurrently; normalization stays
+        # on this thread and in adapter order, keeping ties in the same order as before.
+        with ThreadPoolExecutor(max_workers=len(self.adapters)) as pool:
+            fetched = [pool.submit(_fetch_all, adapter) for adapter in self.adapters]
+            trends: list[NormalizedTrend] = []
+            for adapter, rows in zip(self.adapters, fetched):
+                # Adapters may offer normalize_batch to map a whole page with names bound once.
+                normalize_batch = getattr(adapter, "normalize_batch", None)
+                if normalize_batch is not None:
+                    trends.extend(normalize_batch(rows.result()))
+                else:
+                    normalize = adapter.normalize
+                    trends.extend(normalize(row) for row in rows.result())
+        if top_k is not None:
+            return heapq.nlargest(top_k, trends, key=_SCORE)
+        trends.sort(key=_SCORE, reverse=True)
+        return trends
+
+
+def _intern_label(value: Any) -> Any:
+    # Geo, category and subreddit values come from small domains but arrive as fresh
+    # strings per record; interning lets every trend share one object per label.
+    # Source names and metadata keys are literals, which the compiler already interns.
+    return sys.intern(value) if type(value) is str else value
+
+
+def _fetch_all(adapter: TrendSourceAdapter) -> list[dict[str, Any]]:
+    # Drain lazy iterables inside the worker so the I/O happens off the caller's thread.
+    return list(adapter.fetch())
 
 
 def _parse_ts(value: Any) -> datetime:
     if isinstance(value, datetime):
-        return value.astimezone(timezone.utc)
+        return to_utc(value)
     if isinstance(value, (int, float)):
-        return datetime.fromtimestamp(value, tz=timezone.utc)
+        return datetime.fromtimestamp(value, tz=UTC)
     if isinstance(value, str) and value:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-        return parsed.astimezone(timezone.utc)
-    return datetime.now(tz=timezone.utc)
+        return parse_iso_utc(value)
+    return datetime.now(tz=UTC)
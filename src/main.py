@@ -6,15 +6,25 @@ runbook operations and dry-run/local execution.
 
 from __future__ import annotations
 
-import argparse
+import atexit
 import json
 import logging
+import logging.handlers
+import math
 import os
+import queue
+import re
+import signal
+import threading
 import time
+from collections.abc import Sized
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from time import sleep
-from typing import Callable, Protocol, TYPE_CHECKING
+from functools import cache, lru_cache
+from itertools import repeat
+from operator import itemgetter
+from secrets import token_hex
+from typing import Callable, Iterable, Protocol, TYPE_CHECKING
 from uuid import uuid4
 
 from instagram_ai_system.adaptive_cycle import AdaptiveCycleCoordinator, AdaptiveLoopFlags
@@ -27,11 +37,46 @@ from instagram_ai_system.monetization_analytics import MonetizationAnalyst
 from instagram_ai_system.production_loop import PipelineWorker, run_daily_pipeline
 from instagram_ai_system.shadow_testing import ShadowTestEvaluator
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 if TYPE_CHECKING:
+    import argparse
+
     from instagram_ai_system.storage import Database
 
+_UTC = timezone.utc
+# One shared encoder; json.dumps with non-default options builds a new JSONEncoder per call.
+_JSON_ENCODE = json.JSONEncoder(sort_keys=True).encode
+# Compact, sorted, UTF-8 log records when orjson is not installed. Structurally the same JSON as orjson,
+# but float spelling differs (orjson writes 1e-5 and 1e16 where json writes 1e-05 and 1e+16).
+_STDLIB_LOG_ENCODE = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode
+# (millisecond tick, ISO string) for the most recent _iso_now() call; replaced as one tuple.
+_last_iso_tick: tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string at millisecond precision, formatted once per millisecond."""
+    global _last_iso_tick
+    tick = time.time_ns() // 1_000_000
+    cached_tick, cached_iso = _last_iso_tick
+    if tick == cached_tick:
+        return cached_iso
+    second, millisecond = divmod(tick, 1000)
+    iso = f"{_iso_second(second)}.{millisecond:03d}+00:00"
+    _last_iso_tick = (tick, iso)
+    return iso
+
 
-@dataclass
+@lru_cache(maxsize=2)
+def _iso_second(second: int) -> str:
+    # The date/time prefix only changes once per second; the millisecond tail is appended per tick.
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+
+
+@dataclass(slots=True, frozen=True)
 class RunConfig:
     mode: str  # dry-run | local | production
     once: bool = False
@@ -60,19 +105,39 @@ class Analytics(Protocol):
 
 
 class LocalTrendSource:
-    """Deterministic trend source for dry-run/local orchestration."""
+    """Deterministic trend source for dry-run/local orchestration.
+
+    Trends are cached per topic for ``ttl_seconds`` (``TREND_CACHE_TTL_SECONDS``, default 300);
+    each call still returns fresh copies of them with its own ``fetched_at``.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None) -> None:
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("TREND_CACHE_TTL_SECONDS", "300"))
+        self.ttl_seconds = ttl_seconds
+        self._cache: dict[str, tuple[float, list[dict]]] = {}
 
     def fetch_signals(self, topic: str | None) -> dict:
         inferred_topic = topic or "general"
-        return {
-            "topic": inferred_topic,
-            "trends": [
+        now = time.monotonic()
+        cached = self._cache.get(inferred_topic)
+        if cached is not None and now - cached[0] < self.ttl_seconds:
+            trends = cached[1]
+        else:
+            trends = [
                 {"keyword": f"{inferred_topic} quick tips", "score": 0.93},
                 {"keyword": f"{inferred_topic} mistakes", "score": 0.81},
                 {"keyword": f"{inferred_topic} tools", "score": 0.74},
-            ],
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
-        }
+            ]
+            self._cache[inferred_topic] = (now, trends)
+        # Fresh trend dicts per call, so a consumer that mutates one cannot corrupt later cycles.
+        return {"topic": inferred_topic, "trends": [dict(trend) for trend in trends], "fetched_at": _iso_now()}
+
+
+@lru_cache(maxsize=1024)
+def _candidate_title(keyword: str) -> str:
+    # Trend keywords repeat across cycles (see LocalTrendSource), so the title-cased text is reused.
+    return f"{keyword.title()} in 30 seconds"
 
 
 class LocalCreativeEngine:
@@ -83,7 +148,7 @@ class LocalCreativeEngine:
         return [
             {
                 "id": f"candidate-{i + 1}",
-                "title": f"{trend['keyword'].title()} in 30 seconds",
+                "title": _candidate_title(trend["keyword"]),
                 "hook": f"Stop scrolling: {topic} insight #{i + 1}",
                 "format": "reel",
             }
@@ -91,16 +156,26 @@ class LocalCreativeEngine:
         ]
 
 
+@lru_cache(maxsize=32)
+def _blocked_terms_pattern(terms: frozenset[str]) -> re.Pattern[str]:
+    # One alternation scans each title once in C instead of one substring scan per term.
+    if not terms:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(map(re.escape, sorted(terms))), re.IGNORECASE)
+
+
 class LocalPolicyGuard:
     """Simple validation policy for local execution."""
 
-    blocked_terms = {"banned", "unsafe"}
+    blocked_terms: frozenset[str] = frozenset({"banned", "unsafe"})
 
     def validate(self, candidates: list[dict]) -> list[dict]:
+        # Built from the (possibly overridden) terms and cached per distinct term set.
+        search = _blocked_terms_pattern(frozenset(self.blocked_terms)).search
         approved: list[dict] = []
         for candidate in candidates:
-            title = str(candidate.get("title", "")).lower()
-            if any(term in title for term in self.blocked_terms):
+            title = candidate.get("title", "")
+            if search(title if type(title) is str else str(title)):
                 continue
             approved.append(candidate)
         return approved
@@ -111,51 +186,101 @@ class LocalPublisher:
 
     def publish(self, approved: list[dict], dry_run: bool) -> list[dict]:
         mode = "simulated" if dry_run else "local"
+        # Status and timestamp are the same for the whole batch; compute them once.
+        status = "published" if not dry_run else "simulated"
+        published_at = _iso_now()
         return [
             {
                 "post_id": f"{mode}-{item['id']}",
                 "candidate_id": item["id"],
-                "status": "published" if not dry_run else "simulated",
-                "published_at": datetime.now(timezone.utc).isoformat(),
+                "status": status,
+                "published_at": published_at,
             }
             for item in approved
         ]
 
 
+_STATUS = itemgetter("status")
+
+
 class LocalAnalytics:
     """Analytics adapter with deterministic local KPI estimates."""
 
     def collect(self, published: list[dict]) -> dict:
         published_count = len(published)
-        simulated_count = sum(1 for item in published if item["status"] == "simulated")
+        # Count in C over the status column instead of a generator with a per-item comparison.
+        simulated_count = list(map(_STATUS, published)).count("simulated")
         return {
             "reach_estimate": published_count * 1000,
-            "engagement_estimate": round(published_count * 0.07, 3),
+            # 0.07 per post in integer thousandths: the same value as round(count * 0.07, 3).
+            "engagement_estimate": published_count * 70 / 1000,
             "simulated_count": simulated_count,
         }
 
 
-def _setup_logger() -> logging.Logger:
-    logger = logging.getLogger("orchestrator")
+def _setup_logger(name: str = "orchestrator", *, background: bool = True) -> logging.Logger:
+    logger = logging.getLogger(name)
     if logger.handlers:
         return logger
 
     logger.setLevel(logging.INFO)
     handler = logging.StreamHandler()
     handler.setFormatter(logging.Formatter("%(message)s"))
-    logger.addHandler(handler)
+    if not background:
+        logger.addHandler(handler)
+        return logger
+    # Callers only enqueue records; a background listener thread does the stderr writes.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     return logger
 
 
+def _encode_log_record(record: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return _STDLIB_LOG_ENCODE(record)
+
+
 def _log_event(logger: logging.Logger, *, level: str, event: str, trace_id: str, **payload: object) -> None:
     record = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _iso_now(),
         "event": event,
         "trace_id": trace_id,
         **payload,
     }
     log_method = getattr(logger, level, logger.info)
-    log_method(json.dumps(record, sort_keys=True))
+    log_method(_encode_log_record(record))
+
+
+def _new_trace_id() -> str:
+    """Time-ordered trace id: 12 hex digits of epoch milliseconds, then 64 random bits.
+
+    Ids sort by creation time for log grepping. The random half keeps ids unique even when
+    many cycles start in the same millisecond, which matters because decision log and
+    monetization insight primary keys are derived from the trace id.
+    """
+    return f"{time.time_ns() // 1_000_000:012x}{token_hex(8)}"
+
+
+def _random_hex_ids(count: int) -> list[str]:
+    """Return ``count`` random 128-bit ids as 32-char hex strings from a single urandom read."""
+    raw = os.urandom(16 * count)
+    return [raw[offset : offset + 16].hex() for offset in range(0, 16 * count, 16)]
+
+
+def _record_step(steps: list[dict], step: str, value: object, started: float) -> int | None:
+    """Append a step's size and duration to the cycle's ``steps`` record and return the size."""
+    size = len(value) if isinstance(value, Sized) else None
+    steps.append({"step": step, "size": size, "duration_ms": round((time.monotonic() - started) * 1000, 3)})
+    return size
+
+
+# Database URLs whose schema this process has already created; create_all() reflects
+# every table, so it runs once per URL rather than on every _create_db() call.
+_SCHEMA_INITIALIZED: set[str] = set()
 
 
 def _create_db() -> "Database":
@@ -163,7 +288,11 @@ def _create_db() -> "Database":
 
     database_url = os.getenv("DATABASE_URL", "sqlite+pysqlite:///./automation.db")
     db = Database(database_url)
-    Base.metadata.create_all(db.engine)
+    if database_url not in _SCHEMA_INITIALIZED:
+        Base.metadata.create_all(db.engine)
+        # Each in-memory SQLite engine is a fresh database, so those always need create_all().
+        if db.engine.url.database not in (None, "", ":memory:"):
+            _SCHEMA_INITIALIZED.add(database_url)
     return db
 
 
@@ -179,61 +308,100 @@ def run_cycle(
     logger: logging.Logger | None = None,
 ) -> dict:
     active_logger = logger or _setup_logger()
-    trace_id = str(uuid4())
+    trace_id = _new_trace_id()
     _log_event(active_logger, level="info", event="cycle.started", trace_id=trace_id, mode=config.mode)
 
-    steps = [
-        ("fetch-signals", lambda: trend_source.fetch_signals(config.topic)),
-        ("generate-candidates", lambda: creative_engine.generate_candidates(signals)),
-        ("validate-candidates", lambda: policy_guard.validate(candidates)),
-        ("publish", lambda: publisher.publish(approved, dry_run=(config.mode == "dry-run"))),
-        ("collect-analytics", lambda: analytics.collect(publish_results)),
-        (
-            "adaptive-loop-updates",
-            lambda: adaptive_cycle.process_after_analytics(metrics, trace_id=trace_id) if adaptive_cycle else {},
-        ),
-    ]
-
+    # Per-step outcomes are reported once, on the cycle's final record, rather than as separate events.
+    steps: list[dict] = []
+    step_name = "fetch-signals"
     try:
-        for step_name, step_fn in steps:
-            _log_event(active_logger, level="info", event="step.started", trace_id=trace_id, step=step_name)
-            value = step_fn()
-            size = len(value) if hasattr(value, "__len__") else None
-            _log_event(active_logger, level="info", event="step.succeeded", trace_id=trace_id, step=step_name, size=size)
-
-            if step_name == "fetch-signals":
-                signals = value
-            elif step_name == "generate-candidates":
-                candidates = value
-            elif step_name == "validate-candidates":
-                approved = value
-            elif step_name == "publish":
-                publish_results = value
-            elif step_name == "collect-analytics":
-                metrics = value
-            elif step_name == "adaptive-loop-updates":
-                adaptive_updates = value
-
+        started = time.monotonic()
+        signals = trend_source.fetch_signals(config.topic)
+        signals_count = _record_step(steps, step_name, signals, started)
+
+        step_name = "generate-candidates"
+        started = time.monotonic()
+        candidates = creative_engine.generate_candidates(signals)
+        candidates_count = _record_step(steps, step_name, candidates, started)
+
+        step_name = "validate-candidates"
+        started = time.monotonic()
+        approved = policy_guard.validate(candidates)
+        approved_count = _record_step(steps, step_name, approved, started)
+
+        step_name = "publish"
+        started = time.monotonic()
+        publish_results = publisher.publish(approved, dry_run=(config.mode == "dry-run"))
+        published_count = _record_step(steps, step_name, publish_results, started)
+
+        step_name = "collect-analytics"
+        started = time.monotonic()
+        metrics = analytics.collect(publish_results)
+        _record_step(steps, step_name, metrics, started)
+
+        step_name = "adaptive-loop-updates"
+        started = time.monotonic()
+        adaptive_updates = adaptive_cycle.process_after_analytics(metrics, trace_id=trace_id) if adaptive_cycle else {}
+        _record_step(steps, step_name, adaptive_updates, started)
     except Exception as exc:
-        _log_event(active_logger, level="error", event="step.failed", trace_id=trace_id, step=step_name, error=str(exc))
+        _log_event(
+            active_logger,
+            level="error",
+            event="step.failed",
+            trace_id=trace_id,
+            step=step_name,
+            error=str(exc),
+            steps=steps,
+        )
         raise
 
     summary = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _iso_now(),
         "trace_id": trace_id,
         "mode": config.mode,
-        "signals_count": len(signals),
-        "candidates_count": len(candidates),
-        "approved_count": len(approved),
-        "published_count": len(publish_results),
+        "signals_count": signals_count,
+        "candidates_count": candidates_count,
+        "approved_count": approved_count,
+        "published_count": published_count,
         "metrics": metrics,
         "adaptive_updates": adaptive_updates,
     }
-    _log_event(active_logger, level="info", event="cycle.succeeded", trace_id=trace_id, summary=summary)
+    _log_event(active_logger, level="info", event="cycle.succeeded", trace_id=trace_id, summary=summary, steps=steps)
     return summary
 
 
+async def run_cycle_async(
+    config: RunConfig,
+    trend_source: TrendSource,
+    creative_engine: CreativeEngine,
+    policy_guard: PolicyGuard,
+    publisher: Publisher,
+    analytics: Analytics,
+    *,
+    adaptive_cycle: AdaptiveCycleCoordinator | None = None,
+    logger: logging.Logger | None = None,
+) -> dict:
+    """Run one cycle on a worker thread so an asyncio caller's event loop keeps serving other work."""
+    # Imported here: asyncio is a noticeable share of this module's import time and only async callers need it.
+    import asyncio
+
+    return await asyncio.to_thread(
+        run_cycle,
+        config,
+        trend_source,
+        creative_engine,
+        policy_guard,
+        publisher,
+        analytics,
+        adaptive_cycle=adaptive_cycle,
+        logger=logger,
+    )
+
+
 def _build_parser() -> argparse.ArgumentParser:
+    # Imported here so library callers of run_cycle/run_loop do not pay for argparse.
+    import argparse
+
     parser = argparse.ArgumentParser(description="Run content production automation orchestrator")
     parser.add_argument("--mode", choices=["dry-run", "local", "production"], default="dry-run")
     parser.add_argument("--once", action="store_true", help="Run exactly one cycle")
@@ -246,12 +414,17 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--window", default=None, help="Optional KPI snapshot window filter (for example: 24h, 7d)")
     parser.add_argument("--platform", default=None, help="Optional platform filter for KPI reports")
     parser.add_argument("--output", default="json", choices=["json", "summary"], help="Output format")
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print per-cycle summaries to stdout (they are still logged with cycle.succeeded)",
+    )
     return parser
 
 
 def _format_output(result: dict, output_mode: str) -> str:
     if output_mode == "json":
-        return json.dumps(result, sort_keys=True)
+        return _JSON_ENCODE(result)
 
     lines = ["== Automation Summary =="]
     if "ops" in result:
@@ -285,27 +458,34 @@ def _format_output(result: dict, output_mode: str) -> str:
     return "\n".join(lines)
 
 
-def _aggregate_kpis(period: str, snapshots: list) -> dict:
-    total_posts = len({snap.publish_attempt_id for snap in snapshots})
+def _aggregate_kpis(period: str, per_post_rows: Iterable) -> dict:
+    """Build the KPI report from per-post rows.
+
+    Rows are ``(publish_attempt_id, reach, shares, saves, watch_through_sum, samples)`` as grouped by
+    ``PerformanceSnapshotRepository.aggregate_by_attempt``, so the post and sample counts fall out of the rows.
+    """
     aggregate = {"reach": 0, "shares": 0, "saves": 0, "watch_through": 0.0}
-    per_post: dict[str, dict[str, float]] = {}
-
-    for snap in snapshots:
-        payload = snap.metrics_payload or {}
-        attempt_id = snap.publish_attempt_id
-        post = per_post.setdefault(attempt_id, {"reach": 0, "shares": 0, "saves": 0, "watch_through": 0.0, "samples": 0})
-        post["reach"] += int(payload.get("reach", payload.get("views", 0)) or 0)
-        post["shares"] += int(payload.get("shares", 0) or 0)
-        post["saves"] += int(payload.get("saves", 0) or 0)
-        post["watch_through"] += float(payload.get("watch_through", payload.get("retention", 0.0)) or 0.0)
-        post["samples"] += 1
-
-    for post in per_post.values():
-        aggregate["reach"] += int(post["reach"])
-        aggregate["shares"] += int(post["shares"])
-        aggregate["saves"] += int(post["saves"])
-        aggregate["watch_through"] += float(post["watch_through"] / max(1, post["samples"]))
+    per_post = []
+    samples = 0
+    for pid, reach, shares, saves, watch_through, count in per_post_rows:
+        reach, shares, saves = int(reach or 0), int(shares or 0), int(saves or 0)
+        post_watch_through = float(watch_through or 0.0) / max(1, count)
+        samples += count
+        aggregate["reach"] += reach
+        aggregate["shares"] += shares
+        aggregate["saves"] += saves
+        aggregate["watch_through"] += post_watch_through
+        per_post.append(
+            {
+                "publish_attempt_id": pid,
+                "reach": reach,
+                "shares": shares,
+                "saves": saves,
+                "watch_through": round(post_watch_through, 4),
+            }
+        )
 
+    total_posts = len(per_post)
     aggregate["watch_through"] = round(aggregate["watch_through"] / max(1, total_posts), 4)
     share_rate = round(aggregate["shares"] / max(1, aggregate["reach"]), 4)
     save_rate = round(aggregate["saves"] / max(1, aggregate["reach"]), 4)
@@ -319,17 +499,8 @@ def _aggregate_kpis(period: str, snapshots: list) -> dict:
         "period": period,
         "totals": aggregate,
         "objective_metrics": {"share_rate": share_rate, "save_rate": save_rate, "watch_through": aggregate["watch_through"]},
-        "per_post": [
-            {
-                "publish_attempt_id": pid,
-                "reach": int(m["reach"]),
-                "shares": int(m["shares"]),
-                "saves": int(m["saves"]),
-                "watch_through": round(float(m["watch_through"]) / max(1, m["samples"]), 4),
-            }
-            for pid, m in per_post.items()
-        ],
-        "aggregate_window": {"samples": len(snapshots), "posts": total_posts},
+        "per_post": per_post,
+        "aggregate_window": {"samples": samples, "posts": total_posts},
         "anomaly_flags": anomaly_flags,
     }
 
@@ -338,10 +509,10 @@ def _run_ops(args: argparse.Namespace, *, logger: logging.Logger) -> dict:
     from sqlalchemy import select, text
 
     from instagram_ai_system.storage import OperationRunRepository, PerformanceSnapshotRepository, PublishAttemptRepository
-    from instagram_ai_system.storage.models import PerformanceSnapshotModel, PublishAttemptModel
+    from instagram_ai_system.storage.models import PublishAttemptModel
 
-    trace_id = str(uuid4())
-    started_at = datetime.now(timezone.utc)
+    trace_id = _new_trace_id()
+    started_at = datetime.now(_UTC)
     params_payload = {
         "mode": args.mode,
         "window_hours": args.window_hours,
@@ -362,7 +533,7 @@ def _run_ops(args: argparse.Namespace, *, logger: logging.Logger) -> dict:
             response = {
                 "status": "degraded",
                 "mode": args.mode,
-                "checked_at": datetime.now(timezone.utc).isoformat(),
+                "checked_at": _iso_now(),
                 "dependencies": {"database": "unavailable"},
                 "error": str(exc),
             }
@@ -370,8 +541,12 @@ def _run_ops(args: argparse.Namespace, *, logger: logging.Logger) -> dict:
             return response
         raise
 
+    failure: Exception | None = None
     with db.session_scope() as session:
         run_repo = OperationRunRepository(session)
+        # Left pending until the outcome is known, so the operation row, any writes the
+        # operation makes and its completion status commit together in one transaction,
+        # and SQLite holds no write lock while an operation opens its own connections.
         run_repo.create_run(
             run_id=operation_run_id,
             operation_name=args.ops,
@@ -381,19 +556,13 @@ def _run_ops(args: argparse.Namespace, *, logger: logging.Logger) -> dict:
             trace_id=trace_id,
             started_at=started_at,
         )
-
-    try:
-        with db.session_scope() as session:
-            run_repo = OperationRunRepository(session)
+        try:
             if args.ops == "health-check":
                 dependencies = {"database": "ready", "repositories": "ready"}
                 status = "ok"
                 try:
+                    # The repositories were resolved by the import at the top of this function.
                     session.execute(text("SELECT 1"))
-                    from instagram_ai_system.storage import OperationRunRepository, PublishAttemptRepository, PerformanceSnapshotRepository
-                    _ = OperationRunRepository(session)
-                    _ = PublishAttemptRepository(session)
-                    _ = PerformanceSnapshotRepository(session)
                 except Exception:
                     dependencies["database"] = "unavailable"
                     dependencies["repositories"] = "unavailable"
@@ -401,14 +570,14 @@ def _run_ops(args: argparse.Namespace, *, logger: logging.Logger) -> dict:
                 response = {
                     "status": status,
                     "mode": args.mode,
-                    "checked_at": datetime.now(timezone.utc).isoformat(),
+                    "checked_at": _iso_now(),
                     "dependencies": dependencies,
                 }
             elif args.ops == "refill-queue":
                 response = {"status": "ok", "window_hours": args.window_hours, "queued_items": max(3, args.window_hours // 6)}
             elif args.ops == "replay-failed":
                 attempts = PublishAttemptRepository(session)
-                since = datetime.now(timezone.utc) - timedelta(hours=args.since_hours)
+                since = datetime.now(_UTC) - timedelta(hours=args.since_hours)
                 failed_attempts = list(
                     session.scalars(
                         select(PublishAttemptModel)
@@ -416,58 +585,60 @@ def _run_ops(args: argparse.Namespace, *, logger: logging.Logger) -> dict:
                         .where(PublishAttemptModel.attempted_at >= since)
                     )
                 )
+                already_replayed = run_repo.replayed_failed_run_ids(failed.id for failed in failed_attempts)
+                # Outcomes are decided in memory and written as two bulk inserts after the loop.
+                child_runs: list[dict] = []
+                new_attempts: list[dict] = []
+                # Child run and replay attempt ids drawn from one urandom read for the whole batch.
+                ids = iter(_random_hex_ids(2 * len(failed_attempts)))
                 replayed = 0
                 skipped = 0
                 still_failed = 0
                 for failed in failed_attempts:
-                    child_run_id = str(uuid4())
-                    run_repo.create_run(
-                        run_id=child_run_id,
-                        operation_name="replay-failed",
-                        params_payload={"failed_run_id": failed.id, "source_operation": args.ops},
-                        status="running",
-                        result_payload={},
-                        trace_id=trace_id,
-                        started_at=datetime.now(timezone.utc),
-                    )
-                    if run_repo.was_replayed(failed_run_id=failed.id):
+                    started = datetime.now(_UTC)
+                    child_run = {
+                        "id": next(ids),
+                        "operation_name": "replay-failed",
+                        "params_payload": {"failed_run_id": failed.id, "source_operation": args.ops},
+                        "status": "succeeded",
+                        "trace_id": trace_id,
+                        "started_at": started,
+                        "completed_at": started,
+                        "error_message": None,
+                    }
+                    child_runs.append(child_run)
+                    if failed.id in already_replayed:
                         skipped += 1
-                        run_repo.complete_run(
-                            run_id=child_run_id,
-                            status="succeeded",
-                            result_payload={"status": "skipped", "reason": "already_replayed", "failed_run_id": failed.id},
-                            completed_at=datetime.now(timezone.utc),
-                        )
+                        child_run["result_payload"] = {
+                            "status": "skipped",
+                            "reason": "already_replayed",
+                            "failed_run_id": failed.id,
+                        }
                         continue
                     if failed.response_payload.get("force_still_failed"):
                         still_failed += 1
-                        run_repo.complete_run(
-                            run_id=child_run_id,
-                            status="failed",
-                            result_payload={"status": "still_failed", "failed_run_id": failed.id},
-                            completed_at=datetime.now(timezone.utc),
-                            error_message="Replay attempt failed",
-                        )
+                        child_run["status"] = "failed"
+                        child_run["result_payload"] = {"status": "still_failed", "failed_run_id": failed.id}
+                        child_run["error_message"] = "Replay attempt failed"
                         continue
-                    attempts.create_attempt(
-                        attempt_id=f"replay-{uuid4()}",
-                        brief_asset_id=failed.brief_asset_id,
-                        platform=failed.platform,
-                        status="success",
-                        attempt_number=failed.attempt_number + 1,
-                        response_payload={"replayed_from": failed.id, "idempotency_key": failed.id},
-                        error_message=None,
-                        attempted_at=datetime.now(timezone.utc),
-                        schema_version=failed.schema_version,
-                        trace_id=trace_id,
-                    )
-                    run_repo.complete_run(
-                        run_id=child_run_id,
-                        status="succeeded",
-                        result_payload={"status": "replayed", "failed_run_id": failed.id},
-                        completed_at=datetime.now(timezone.utc),
+                    new_attempts.append(
+                        {
+                            "id": f"replay-{next(ids)}",
+                            "brief_asset_id": failed.brief_asset_id,
+                            "platform": failed.platform,
+                            "status": "success",
+                            "attempt_number": failed.attempt_number + 1,
+                            "response_payload": {"replayed_from": failed.id, "idempotency_key": failed.id},
+                            "error_message": None,
+                            "attempted_at": started,
+                            "schema_version": failed.schema_version,
+                            "trace_id": trace_id,
+                        }
                     )
+                    child_run["result_payload"] = {"status": "replayed", "failed_run_id": failed.id}
                     replayed += 1
+                run_repo.create_runs(child_runs)
+                attempts.create_attempts(new_attempts)
                 response = {
                     "status": "ok",
                     "since_hours": args.since_hours,
@@ -494,47 +665,77 @@ def _run_ops(args: argparse.Namespace, *, logger: logging.Logger) -> dict:
                 }
             elif args.ops == "kpi-report":
                 period_hours = 24 if args.period == "daily" else 24 * 7
-                since = datetime.now(timezone.utc) - timedelta(hours=period_hours)
-                stmt = select(PerformanceSnapshotModel).where(PerformanceSnapshotModel.captured_at >= since)
-                if args.window:
-                    stmt = stmt.where(PerformanceSnapshotModel.window == args.window)
-                if args.platform:
-                    stmt = stmt.join(
-                        PublishAttemptModel,
-                        PublishAttemptModel.id == PerformanceSnapshotModel.publish_attempt_id,
-                    ).where(PublishAttemptModel.platform == args.platform)
-                snapshots = list(
-                    session.scalars(stmt)
+                since = datetime.now(_UTC) - timedelta(hours=period_hours)
+                per_post_rows = PerformanceSnapshotRepository(session).aggregate_by_attempt(
+                    since=since, window=args.window, platform=args.platform
                 )
                 response = {
                     "status": "ok",
                     "ops": args.ops,
                     "filters": {"window": args.window, "platform": args.platform},
-                    **_aggregate_kpis(args.period, snapshots),
+                    **_aggregate_kpis(args.period, per_post_rows),
                 }
             else:
                 raise ValueError(f"Unsupported operation: {args.ops}")
-
+        except Exception as exc:
+            # Discard the operation's partial writes but still record the run as failed.
+            session.rollback()
+            run_repo.create_run(
+                run_id=operation_run_id,
+                operation_name=args.ops,
+                params_payload=params_payload,
+                status="failed",
+                result_payload={"error": str(exc)},
+                trace_id=trace_id,
+                started_at=started_at,
+                completed_at=datetime.now(_UTC),
+                error_message=str(exc),
+            )
+            failure = exc
+        else:
             run_repo.complete_run(
                 run_id=operation_run_id,
                 status="succeeded",
                 result_payload=response,
-                completed_at=datetime.now(timezone.utc),
+                completed_at=datetime.now(_UTC),
             )
 
-        _log_event(logger, level="info", event="ops.succeeded", trace_id=trace_id, operation=args.ops, result=response)
-        return response
-    except Exception as exc:
-        with db.session_scope() as session:
-            OperationRunRepository(session).complete_run(
-                run_id=operation_run_id,
-                status="failed",
-                result_payload={"error": str(exc)},
-                completed_at=datetime.now(timezone.utc),
-                error_message=str(exc),
-            )
-        _log_event(logger, level="error", event="ops.failed", trace_id=trace_id, operation=args.ops, error=str(exc))
-        raise
+    if failure is not None:
+        _log_event(logger, level="error", event="ops.failed", trace_id=trace_id, operation=args.ops, error=str(failure))
+        raise failure
+    _log_event(logger, level="info", event="ops.succeeded", trace_id=trace_id, operation=args.ops, result=response)
+    return response
+
+
+# Set by SIGTERM/SIGINT during main()'s cycle loop; the loops wait on it between cycles so shutdown is immediate.
+_shutdown = threading.Event()
+_SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+# Handlers replaced by _install_shutdown_handlers, restored on a second signal or when the loop ends.
+_previous_signal_handlers: dict[int, object] = {}
+
+
+def _request_shutdown(signum: int, frame: object) -> None:
+    _shutdown.set()
+    # The first signal lets the current cycle finish; a second one gets the original behaviour
+    # (KeyboardInterrupt for SIGINT, termination for SIGTERM) so an operator can force an exit.
+    signal.signal(signum, _previous_signal_handlers.get(signum, signal.SIG_DFL))
+
+
+def _install_shutdown_handlers() -> None:
+    # A signal left over from an earlier loop in this process must not stop the new one immediately.
+    _shutdown.clear()
+    for signum in _SHUTDOWN_SIGNALS:
+        _previous_signal_handlers[signum] = signal.signal(signum, _request_shutdown)
+
+
+def _restore_signal_handlers() -> None:
+    while _previous_signal_handlers:
+        signum, handler = _previous_signal_handlers.popitem()
+        signal.signal(signum, handler)
+
+
+def _wait_for_shutdown(seconds: float) -> None:
+    _shutdown.wait(seconds)
 
 
 def run_loop(
@@ -545,33 +746,117 @@ def run_loop(
     publisher: Publisher,
     analytics: Analytics,
     adaptive_cycle: AdaptiveCycleCoordinator | None = None,
-    sleep_fn: Callable[[int], None] = sleep,
+    sleep_fn: Callable[[int], None] = _wait_for_shutdown,
     max_cycles: int | None = None,
+    *,
+    on_cycle: Callable[[dict], None] | None = None,
+    collect: bool = True,
+    parallel_cycles: int = 1,
 ) -> list[dict]:
+    """Run cycles until ``config.once`` or ``max_cycles``; each summary goes to ``on_cycle`` if given.
+
+    Summaries are also returned as a list unless ``collect`` is False, which long-running
+    callers should use so memory does not grow with the number of cycles.
+
+    With ``parallel_cycles > 1`` and a bounded ``max_cycles``, the cycles run back-to-back
+    (no interval pacing) across that many worker processes; the adapters must be picklable
+    and stateless, and ``adaptive_cycle`` must be None since its state cannot be shared.
+    """
+    if max_cycles is not None and max_cycles < 1:
+        raise ValueError("max_cycles must be at least 1")
+    if parallel_cycles > 1 and max_cycles is not None and not config.once:
+        if adaptive_cycle is not None:
+            raise ValueError("parallel_cycles requires adaptive_cycle=None")
+        return _run_cycles_in_processes(
+            config,
+            (trend_source, creative_engine, policy_guard, publisher, analytics),
+            max_cycles,
+            parallel_cycles,
+            on_cycle=on_cycle,
+            collect=collect,
+        )
+
     results: list[dict] = []
+    cycles = 0
+    # Cycles start on a fixed cadence: the sleep absorbs the cycle's own run time.
+    next_start = time.monotonic()
     while True:
-        results.append(
-            run_cycle(
-                config=config,
-                trend_source=trend_source,
-                creative_engine=creative_engine,
-                policy_guard=policy_guard,
-                publisher=publisher,
-                analytics=analytics,
-                adaptive_cycle=adaptive_cycle,
-            )
+        summary = run_cycle(
+            config=config,
+            trend_source=trend_source,
+            creative_engine=creative_engine,
+            policy_guard=policy_guard,
+            publisher=publisher,
+            analytics=analytics,
+            adaptive_cycle=adaptive_cycle,
         )
+        cycles += 1
+        if on_cycle is not None:
+            on_cycle(summary)
+        if collect:
+            results.append(summary)
 
         if config.once:
             break
-        if max_cycles is not None and len(results) >= max_cycles:
+        if max_cycles is not None and cycles >= max_cycles:
             break
 
-        sleep_fn(config.interval_seconds)
+        next_start, delay = _next_cycle_delay(next_start, config.interval_seconds)
+        if delay > 0:
+            sleep_fn(math.ceil(delay))
+        if _shutdown.is_set():
+            break
 
     return results
 
 
+def _run_cycle_in_worker(config: RunConfig, adapters: tuple) -> dict:
+    trend_source, creative_engine, policy_guard, publisher, analytics = adapters
+    # Pool workers exit without running atexit hooks, which is where the queue listener is
+    # drained, so they log synchronously instead.
+    logger = _setup_logger("orchestrator-worker", background=False)
+    return run_cycle(config, trend_source, creative_engine, policy_guard, publisher, analytics, logger=logger)
+
+
+def _run_cycles_in_processes(
+    config: RunConfig,
+    adapters: tuple,
+    cycles: int,
+    workers: int,
+    *,
+    on_cycle: Callable[[dict], None] | None,
+    collect: bool,
+) -> list[dict]:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: list[dict] = []
+    # Spawn rather than fork: by now the parent usually runs the log listener and audit drain
+    # threads, and forking a multi-threaded process can deadlock on their inherited locks.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, cycles), mp_context=context) as executor:
+        # map() yields in submission order, so summaries arrive in cycle order.
+        for summary in executor.map(_run_cycle_in_worker, repeat(config, cycles), repeat(adapters, cycles)):
+            if on_cycle is not None:
+                on_cycle(summary)
+            if collect:
+                results.append(summary)
+    return results
+
+
+def _next_cycle_delay(previous_start: float, interval_seconds: int) -> tuple[float, float]:
+    """Return the next cycle's monotonic start time and the seconds left until it.
+
+    A cycle that overran its slot restarts the cadence from now instead of firing
+    back-to-back catch-up cycles.
+    """
+    now = time.monotonic()
+    next_start = previous_start + interval_seconds
+    if next_start <= now:
+        return now, 0.0
+    return next_start, next_start - now
+
+
 def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
@@ -597,26 +882,33 @@ def main() -> None:
     publisher = LocalPublisher()
     analytics = LocalAnalytics()
     optimization = OptimizationConfig()
+    # Built on the first decision payload and then shared, instead of a new engine and
+    # create_all() per adaptive cycle.
+    decision_db = cache(_create_db)
+
     def _decision_sink(payload: dict) -> None:
-        db = _create_db()
-        with db.session_scope() as session:
-            from instagram_ai_system.storage import DecisionLogRepository, MonetizationInsightRepository
+        from instagram_ai_system.storage import DecisionLogRepository, MonetizationInsightRepository
 
+        with decision_db().session_scope() as session:
             updates = payload.get("updates", {})
-            for key, value in updates.items():
-                DecisionLogRepository(session).create(
-                    decision_id=f"{payload['trace_id']}:{key}",
+            DecisionLogRepository(session).create_many(
+                [
+                    {
+                        "id": f"{payload['trace_id']}:{key}",
+                        "run_id": payload["trace_id"],
+                        "decision_type": key,
+                        "decision_payload": value,
+                        "trace_id": payload["trace_id"],
+                    }
+                    for key, value in updates.items()
+                ]
+            )
+            if "monetization_analytics" in updates:
+                MonetizationInsightRepository(session).create(
+                    insight_id=f"{payload['trace_id']}:monetization",
                     run_id=payload["trace_id"],
-                    decision_type=key,
-                    decision_payload=value,
-                    trace_id=payload["trace_id"],
+                    insight_payload=updates["monetization_analytics"],
                 )
-                if key == "monetization_analytics":
-                    MonetizationInsightRepository(session).create(
-                        insight_id=f"{payload['trace_id']}:monetization",
-                        run_id=payload["trace_id"],
-                        insight_payload=value,
-                    )
 
     adaptive_cycle = AdaptiveCycleCoordinator(
         optimization=optimization,
@@ -634,24 +926,41 @@ def main() -> None:
         ),
     )
 
-    while True:
-        summary = run_cycle(
-            config=config,
-            trend_source=trend_source,
-            creative_engine=creative_engine,
-            policy_guard=policy_guard,
-            publisher=publisher,
-            analytics=analytics,
-            adaptive_cycle=adaptive_cycle,
-            logger=logger,
-        )
-        print(_format_output(summary, args.output))
-
-        if config.once:
-            break
-
-        _log_event(logger, level="info", event="cycle.sleeping", trace_id=summary["trace_id"], interval_seconds=config.interval_seconds)
-        time.sleep(config.interval_seconds)
+    # Only the continuous loop defers signals: --ops runs and one-shot pipelines keep the
+    # default Ctrl-C/SIGTERM behaviour.
+    _install_shutdown_handlers()
+    try:
+        next_start = time.monotonic()
+        while True:
+            summary = run_cycle(
+                config=config,
+                trend_source=trend_source,
+                creative_engine=creative_engine,
+                policy_guard=policy_guard,
+                publisher=publisher,
+                analytics=analytics,
+                adaptive_cycle=adaptive_cycle,
+                logger=logger,
+            )
+            if not args.quiet:
+                print(_format_output(summary, args.output))
+
+            if config.once or _shutdown.is_set():
+                break
+
+            next_start, delay = _next_cycle_delay(next_start, config.interval_seconds)
+            _log_event(
+                logger,
+                level="info",
+                event="cycle.sleeping",
+                trace_id=summary["trace_id"],
+                interval_seconds=config.interval_seconds,
+                sleep_seconds=round(delay, 3),
+            )
+            if delay > 0 and _shutdown.wait(delay):
+                break
+    finally:
+        _restore_signal_handlers()
 
 
 if __name__ == "__main__":
@@ -1,3 +1,7 @@
+import copy
+import dataclasses
+import json
+
 import pytest
 
 from datetime import datetime, timezone
@@ -42,6 +46,7 @@ def test_trend_aggregator_fetches_and_normalizes_multiple_sources() -> None:
     assert len(trends) == 2
     assert {trend.source for trend in trends} == {"google_trends", "reddit_trends"}
     assert trends[0].score >= trends[1].score
+    assert aggregator.fetch_and_normalize(top_k=1) == trends[:1]
 
 
 class FakePublisherClient:
@@ -78,6 +83,10 @@ def test_publisher_uses_retry_backoff_idempotency_and_dry_run() -> None:
     assert result.platform_post_id == "ig_123"
     assert result.attempts == 2
     assert sleep_calls == [0.01]
+    retry = next(entry for entry in publisher.audit_log if entry.event == "publish_retry")
+    assert retry.payload is result.payload
+    assert retry.merged_payload()["error"] == "temporary outage"
+    assert all(entry.payload is result.payload for entry in publisher.audit_log)
 
     duplicate = publisher.publish(request)
     assert duplicate.status == "duplicate_ignored"
@@ -88,9 +97,167 @@ def test_publisher_uses_retry_backoff_idempotency_and_dry_run() -> None:
     assert dry_result.status == "dry_run"
     assert dry_client.calls == 0
     assert any(entry.event == "publish_dry_run" for entry in dry_run_publisher.audit_log)
+    assert all(entry.timestamp.tzinfo is timezone.utc for entry in dry_run_publisher.audit_log)
+
+
+def test_publisher_backoff_schedule_is_capped_and_jittered() -> None:
+    capped = InstagramPublisher(
+        client=FakePublisherClient(),
+        max_retries=5,
+        base_backoff_seconds=1.0,
+        max_backoff_seconds=3.0,
+    )
+    assert [capped._backoff_delay(attempt) for attempt in range(1, 5)] == [1.0, 2.0, 3.0, 3.0]
+
+    jittered = InstagramPublisher(client=FakePublisherClient(), base_backoff_seconds=1.0, backoff_jitter=0.25)
+    assert all(1.0 <= jittered._backoff_delay(1) <= 1.25 for _ in range(20))
+
+
+def test_publisher_dedup_memory_is_bounded_to_recent_keys() -> None:
+    publisher = InstagramPublisher(client=FakePublisherClient(), dry_run=True, dedup_capacity=2)
+    approvals = {"editorial": True, "compliance": True, "rights": True}
+
+    def publish(brief_id: str) -> str:
+        return publisher.publish(
+            PublishRequest(brief_id=brief_id, media_url="https://cdn/reel.mp4", caption="Caption", approvals=approvals)
+        ).status
+
+    statuses = [publish("a"), publish("b"), publish("a"), publish("c")]
+    assert statuses == ["dry_run", "dry_run", "duplicate_ignored", "dry_run"]
+    assert publish("a") == "duplicate_ignored"
+    assert publish("b") == "dry_run"
+
+
+class FakeBatchPublisherClient:
+    def __init__(self):
+        self.batches = []
+
+    def publish_post_batch(self, payloads, idempotency_keys):
+        self.batches.append(list(idempotency_keys))
+        if len(self.batches) == 1:
+            raise TransientPublishError("temporary outage")
+        return [{"post_id": f"ig_{payload['brief_id']}"} for payload in payloads]
+
+
+def test_publisher_publish_many_batches_live_posts_and_dedupes() -> None:
+    approvals = {"editorial": True, "compliance": True, "rights": True}
+    requests = [
+        PublishRequest(brief_id=brief_id, media_url="https://cdn/reel.mp4", caption="Caption", approvals=approvals)
+        for brief_id in ("a", "b", "a", "c")
+    ]
+    client = FakeBatchPublisherClient()
+    sleep_calls = []
+    publisher = InstagramPublisher(
+        client=client,
+        base_backoff_seconds=0.01,
+        sleeper=sleep_calls.append,
+        max_batch_size=2,
+    )
+
+    results = publisher.publish_many(requests)
+
+    assert [result.status for result in results] == ["published", "published", "duplicate_ignored", "published"]
+    assert [result.platform_post_id for result in results] == ["ig_a", "ig_b", None, "ig_c"]
+    assert [len(batch) for batch in client.batches] == [2, 2, 1]
+    assert sleep_calls == [0.01]
+    assert [result.status for result in publisher.publish_many(requests[:1])] == ["duplicate_ignored"]
+
+    events_for_b = [entry.event for entry in publisher.audit_log if entry.idempotency_key == results[1].idempotency_key]
+    assert events_for_b == ["publish_attempt", "publish_retry", "publish_success"]
+    assert [entry.event for entry in publisher.audit_log].count("publish_duplicate") == 2
+
+    sequential = InstagramPublisher(client=FakePublisherClient(), sleeper=lambda _: None)
+    assert [result.status for result in sequential.publish_many(requests[:2])] == ["published", "published"]
+
+    with pytest.raises(GovernanceApprovalError):
+        publisher.publish_many([requests[0], PublishRequest(brief_id="d", media_url="m", caption="c")])
+
+
+class ShortBatchPublisherClient:
+    def publish_post_batch(self, payloads, idempotency_keys):
+        return [{"post_id": "ig_only_one"}]
+
+
+def test_publisher_publish_many_rejects_short_batch_responses() -> None:
+    approvals = {"editorial": True, "compliance": True, "rights": True}
+    requests = [
+        PublishRequest(brief_id=brief_id, media_url="https://cdn/reel.mp4", caption="Caption", approvals=approvals)
+        for brief_id in ("a", "b")
+    ]
+    publisher = InstagramPublisher(client=ShortBatchPublisherClient(), sleeper=lambda _: None)
+
+    with pytest.raises(RuntimeError, match="1 responses for 2 payloads"):
+        publisher.publish_many(requests)
+
+    assert [entry.event for entry in publisher.audit_log].count("publish_failed") == 2
+    # Nothing from the ambiguous batch is treated as already published.
+    assert [result.status for result in publisher.publish_many(requests[:1])] == ["published"]
+
+
+def test_publisher_forwards_audit_entries_to_sink_in_batches() -> None:
+    written = []
+    publisher = InstagramPublisher(client=FakePublisherClient(), dry_run=True, audit_sink=written.append)
+    request = PublishRequest(
+        brief_id="brief-1",
+        media_url="https://cdn/reel.mp4",
+        caption="Caption",
+        approvals={"editorial": True, "compliance": True, "rights": True},
+    )
+
+    publisher.publish(request)
+    publisher.publish(request)
+    publisher.flush_audit()
 
+    assert [entry.event for batch in written for entry in batch] == [entry.event for entry in publisher.audit_log]
 
 
+def test_publisher_close_drains_audit_entries_and_stops_the_thread() -> None:
+    written = []
+    request = PublishRequest(
+        brief_id="brief-1",
+        media_url="https://cdn/reel.mp4",
+        caption="Caption",
+        approvals={"editorial": True, "compliance": True, "rights": True},
+    )
+
+    with InstagramPublisher(client=FakePublisherClient(), dry_run=True, audit_sink=written.append) as publisher:
+        thread = publisher._audit_thread
+        publisher.publish(request)
+
+    assert not thread.is_alive()
+    assert [entry.event for batch in written for entry in batch] == ["publish_attempt", "publish_dry_run"]
+
+    publisher.publish(request)
+    publisher.close()
+    assert len(publisher.audit_log) == 4
+    assert sum(len(batch) for batch in written) == 2
+
+
+def test_publisher_idempotency_key_separates_fields() -> None:
+    publisher = InstagramPublisher(client=FakePublisherClient(), dry_run=True)
+
+    def key(**overrides) -> str:
+        fields = {"brief_id": "brief-1", "media_url": "https://cdn/reel.mp4", "caption": "Caption", **overrides}
+        return publisher._prepare(PublishRequest(**fields))[0]
+
+    assert key() == key()
+    assert key().startswith("v2:") and len(key()) == 67
+    assert key(brief_id="brief-1h", media_url="ttps://cdn/reel.mp4") != key()
+    assert key(brief_id="a\x00b", media_url="c") != key(brief_id="a", media_url="b\x00c")
+    assert key(scheduled_at=datetime(2026, 1, 1, tzinfo=timezone.utc)) != key()
+
+
+def test_publisher_idempotency_key_is_stable_for_a_fixed_request() -> None:
+    publisher = InstagramPublisher(client=FakePublisherClient(), dry_run=True)
+    request = PublishRequest(
+        brief_id="brief-1",
+        media_url="https://cdn/reel.mp4",
+        caption="Caption",
+        scheduled_at=datetime(2026, 1, 1, 9, 30, tzinfo=timezone.utc),
+    )
+
+    assert publisher._prepare(request)[0] == "v2:02870308f4996eb3dcac42e74a1d4caca631bc7b444da3e4c8dce953ed8e1cb7"
+
 
 def test_publisher_blocks_publish_when_required_approvals_missing() -> None:
     publisher = InstagramPublisher(client=FakePublisherClient(), dry_run=True)
@@ -128,3 +295,33 @@ def test_metrics_collector_maps_native_fields_to_canonical_schema() -> None:
     assert snapshot.metrics["retention"] == 0.6
     assert snapshot.metrics["profileVisits"] == 40
     assert snapshot.derived_rates["likeRate"] == 0.12
+    assert snapshot.views == 1000
+    assert snapshot.profile_visits == 40
+    # The mapping properties are plain copies, so the snapshot still serializes like a plain dataclass.
+    assert json.loads(json.dumps(snapshot.metrics))["profileVisits"] == 40
+    assert "metrics" not in dataclasses.asdict(snapshot)
+    assert set(dataclasses.asdict(snapshot)) == {field.name for field in dataclasses.fields(snapshot)}
+    assert copy.deepcopy(snapshot) == snapshot
+
+
+def test_metrics_collector_maps_batches_in_order() -> None:
+    collector = InstagramMetricsCollector()
+    captured_at = datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat()
+
+    snapshots = collector.map_many(
+        ["ig_1", "ig_2"],
+        [
+            {"plays": 200, "likes": 20, "captured_at": captured_at},
+            {"plays": 0, "likes": 3, "video_length_seconds": 0, "captured_at": captured_at},
+        ],
+        window="7d",
+    )
+
+    assert [snap.published_post_id for snap in snapshots] == ["ig_1", "ig_2"]
+    assert snapshots[0].derived_rates["likeRate"] == 0.1
+    assert snapshots[1].derived_rates["likeRate"] == 3.0
+    assert snapshots[1].retention == 0.0
+    assert {snap.window for snap in snapshots} == {"7d"}
+
+    with pytest.raises(ValueError, match="same length"):
+        collector.map_many(["ig_1"], [])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import logging
 import os
@@ -9,7 +10,8 @@ from datetime import datetime, timezone
 
 import pytest
 
-from main import RunConfig, _format_output, _run_ops, main, run_cycle, run_loop
+import main as main_module
+from main import RunConfig, _format_output, _run_ops, main, run_cycle, run_cycle_async, run_loop
 
 try:
     import sqlalchemy  # noqa: F401
@@ -127,6 +129,206 @@ def test_run_loop_repeated_path_stops_at_max_cycles_and_sleeps_between_cycles()
     assert sleep_calls == [7]
 
 
+def test_run_loop_stops_after_shutdown_is_requested(monkeypatch) -> None:
+    signal = main_module.signal
+    monkeypatch.setattr(main_module, "_shutdown", main_module.threading.Event())
+    main_module._shutdown.set()
+
+    main_module._install_shutdown_handlers()
+    try:
+        assert not main_module._shutdown.is_set()
+        results = run_loop(
+            config=RunConfig(mode="local", once=False, interval_seconds=5),
+            trend_source=RetryingTrendSource(),
+            creative_engine=DeterministicCreativeEngine(),
+            policy_guard=FirstOnlyPolicyGuard(),
+            publisher=RecordingPublisher(calls=[]),
+            analytics=DeterministicAnalytics(),
+            sleep_fn=lambda sec: main_module._request_shutdown(signal.SIGTERM, None),
+            max_cycles=5,
+        )
+    finally:
+        main_module._restore_signal_handlers()
+
+    assert len(results) == 1
+    assert signal.getsignal(signal.SIGTERM) is not main_module._request_shutdown
+
+
+def test_second_shutdown_signal_restores_the_original_handler(monkeypatch) -> None:
+    signal = main_module.signal
+    monkeypatch.setattr(main_module, "_shutdown", main_module.threading.Event())
+    original = signal.getsignal(signal.SIGINT)
+
+    main_module._install_shutdown_handlers()
+    try:
+        assert signal.getsignal(signal.SIGINT) is main_module._request_shutdown
+        main_module._request_shutdown(signal.SIGINT, None)
+        assert main_module._shutdown.is_set()
+        assert signal.getsignal(signal.SIGINT) is original
+    finally:
+        main_module._restore_signal_handlers()
+
+    assert signal.getsignal(signal.SIGINT) is original
+    assert signal.getsignal(signal.SIGTERM) is not main_module._request_shutdown
+
+
+def test_local_policy_guard_honours_overridden_blocked_terms() -> None:
+    class SpamGuard(main_module.LocalPolicyGuard):
+        blocked_terms = frozenset({"spam"})
+
+    candidates = [{"title": "Spam alert"}, {"title": "Unsafe trick"}, {"title": "Banned list"}]
+
+    assert SpamGuard().validate(candidates) == candidates[1:]
+    assert main_module.LocalPolicyGuard().validate(candidates) == candidates[:1]
+
+    guard = main_module.LocalPolicyGuard()
+    guard.blocked_terms = frozenset()
+    assert guard.validate(candidates) == candidates
+
+
+def test_run_loop_streams_summaries_without_collecting() -> None:
+    seen: list[dict] = []
+    results = run_loop(
+        config=RunConfig(mode="local", once=False, interval_seconds=0),
+        trend_source=RetryingTrendSource(),
+        creative_engine=DeterministicCreativeEngine(),
+        policy_guard=FirstOnlyPolicyGuard(),
+        publisher=RecordingPublisher(calls=[]),
+        analytics=DeterministicAnalytics(),
+        sleep_fn=lambda sec: None,
+        max_cycles=3,
+        on_cycle=seen.append,
+        collect=False,
+    )
+
+    assert results == []
+    assert [summary["published_count"] for summary in seen] == [1, 1, 1]
+
+
+def test_run_loop_parallel_cycles_runs_bounded_cycles_in_worker_processes() -> None:
+    results = run_loop(
+        config=RunConfig(mode="dry-run", once=False, topic="ai", interval_seconds=0),
+        trend_source=main_module.LocalTrendSource(),
+        creative_engine=main_module.LocalCreativeEngine(),
+        policy_guard=main_module.LocalPolicyGuard(),
+        publisher=main_module.LocalPublisher(),
+        analytics=main_module.LocalAnalytics(),
+        max_cycles=3,
+        parallel_cycles=2,
+    )
+
+    assert [summary["published_count"] for summary in results] == [3, 3, 3]
+    assert len({summary["trace_id"] for summary in results}) == 3
+
+
+@pytest.mark.parametrize("parallel_cycles", [1, 2])
+def test_run_loop_rejects_non_positive_max_cycles_on_both_paths(parallel_cycles: int) -> None:
+    with pytest.raises(ValueError, match="max_cycles must be at least 1"):
+        run_loop(
+            config=RunConfig(mode="dry-run", once=False, interval_seconds=0),
+            trend_source=RetryingTrendSource(),
+            creative_engine=DeterministicCreativeEngine(),
+            policy_guard=FirstOnlyPolicyGuard(),
+            publisher=RecordingPublisher(calls=[]),
+            analytics=DeterministicAnalytics(),
+            sleep_fn=lambda sec: None,
+            max_cycles=0,
+            parallel_cycles=parallel_cycles,
+        )
+
+
+def test_run_cycle_async_matches_sync_cycle() -> None:
+    publisher = RecordingPublisher(calls=[])
+
+    summary = asyncio.run(
+        run_cycle_async(
+            config=RunConfig(mode="dry-run", once=True, topic="ai"),
+            trend_source=RetryingTrendSource(),
+            creative_engine=DeterministicCreativeEngine(),
+            policy_guard=FirstOnlyPolicyGuard(),
+            publisher=publisher,
+            analytics=DeterministicAnalytics(),
+        )
+    )
+
+    assert summary["published_count"] == 1
+    assert publisher.calls == [True]
+
+
+def test_next_cycle_delay_keeps_fixed_cadence_and_resets_after_overrun(monkeypatch) -> None:
+    monkeypatch.setattr(main_module.time, "monotonic", lambda: 103.0)
+
+    assert main_module._next_cycle_delay(100.0, 10) == (110.0, 7.0)
+    assert main_module._next_cycle_delay(90.0, 10) == (103.0, 0.0)
+
+
+def test_local_trend_source_caches_trends_per_topic_within_ttl(monkeypatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(main_module.time, "monotonic", lambda: clock[0])
+    source = main_module.LocalTrendSource(ttl_seconds=60)
+
+    first = source.fetch_signals("fitness")
+    second = source.fetch_signals("fitness")
+    assert second is not first
+    assert second["trends"] == first["trends"]
+    assert second["trends"] is not first["trends"]
+    first["trends"][0]["keyword"] = "mutated"
+    assert source.fetch_signals("fitness")["trends"][0]["keyword"] == "fitness quick tips"
+    assert source.fetch_signals(None)["trends"][0]["keyword"] == "general quick tips"
+
+    cached = source._cache["fitness"][1]
+    clock[0] += 60
+    source.fetch_signals("fitness")
+    assert source._cache["fitness"][1] is not cached
+
+
+def test_trace_ids_sort_by_creation_time(monkeypatch) -> None:
+    clock = iter([1_000_000_000, 1_000_000_000, 2_000_000_000])
+    monkeypatch.setattr(main_module.time, "time_ns", lambda: next(clock))
+
+    first, same_ms, later = (main_module._new_trace_id() for _ in range(3))
+
+    assert len(first) == 28 and int(first, 16) >= 0
+    assert first[:12] == same_ms[:12] == f"{1000:012x}" and first != same_ms
+    assert sorted([later, first]) == [first, later]
+
+
+def test_iso_now_matches_datetime_isoformat(monkeypatch) -> None:
+    monkeypatch.setattr(main_module, "_last_iso_tick", (-1, ""))
+    monkeypatch.setattr(main_module.time, "time_ns", lambda: 1_767_225_601_007_999_999)
+
+    expected = datetime.fromtimestamp(1_767_225_601.007, timezone.utc).isoformat(timespec="milliseconds")
+    assert main_module._iso_now() == expected == "2026-01-01T00:00:01.007+00:00"
+
+
+def test_run_cycle_reports_steps_on_the_final_cycle_record(caplog) -> None:
+    logger = logging.getLogger("test.cycle-events")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        run_cycle(
+            config=RunConfig(mode="dry-run", once=True, topic="ai"),
+            trend_source=RetryingTrendSource(),
+            creative_engine=DeterministicCreativeEngine(),
+            policy_guard=FirstOnlyPolicyGuard(),
+            publisher=RecordingPublisher(calls=[]),
+            analytics=DeterministicAnalytics(),
+            logger=logger,
+        )
+
+    records = [json.loads(record.getMessage()) for record in caplog.records]
+    assert [record["event"] for record in records] == ["cycle.started", "cycle.succeeded"]
+    steps = records[-1]["steps"]
+    assert [(step["step"], step["size"]) for step in steps] == [
+        ("fetch-signals", 2),
+        ("generate-candidates", 2),
+        ("validate-candidates", 1),
+        ("publish", 1),
+        ("collect-analytics", 2),
+        ("adaptive-loop-updates", 0),
+    ]
+    assert all(step["duration_ms"] >= 0 for step in steps)
+
+
 def test_run_cycle_partial_ingestion_metrics_surface_without_breaking_cycle() -> None:
     result = run_cycle(
         config=RunConfig(mode="local", once=True, topic=None),
@@ -77,3 +77,29 @@ post-2,,24h,1000,0,0,2,1,0,0,0
         end=datetime.fromisoformat("2026-01-31T00:00:00+00:00"),
     )
     assert len(queried) == 2
+
+
+def test_script_generation_reads_the_current_idea_from_a_reused_wrapper() -> None:
+    ideas_payload = IdeaGenerationService().generate(
+        IdeaGenerationRequest(niche="personal finance basics", count=10)
+    )
+    idea = {"payload": ideas_payload["payload"]["ideas"][0]}
+    script_service = ScriptGenerationService()
+
+    scripts = [
+        script_service.generate(
+            ScriptGenerationRequest(idea=idea, duration_seconds=duration, tone="educational", cta_preference="Save this")
+        )
+        for duration in (15, 30, 45)
+    ]
+
+    assert {script["payload"]["source_idea_id"] for script in scripts} == {idea["payload"]["idea_id"]}
+    assert len({script["payload"]["script_id"] for script in scripts}) == 3
+
+    # Callers may recycle one wrapper dict across ideas; each call must see the current payload.
+    for next_idea in ideas_payload["payload"]["ideas"][1:3]:
+        idea["payload"] = next_idea
+        other = script_service.generate(
+            ScriptGenerationRequest(idea=idea, duration_seconds=30, tone="educational", cta_preference="Save this")
+        )
+        assert other["payload"]["source_idea_id"] == next_idea["idea_id"]
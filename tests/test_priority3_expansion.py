@@ -9,7 +9,7 @@ from instagram_ai_system.experiment_optimizer import ExperimentOptimizer
 from instagram_ai_system.learning_strategy_updates import LearningLoopUpdater, ObjectiveAwareStrategyUpdater
 from instagram_ai_system.mode_controller import ModeController
 from instagram_ai_system.monetization_analytics import MonetizationAnalyst
-from instagram_ai_system.schema_validation import SchemaValidationError, validate_payload
+from instagram_ai_system.schema_validation import SchemaValidationError, compile_validator, validate_payload
 from instagram_ai_system.shadow_testing import ShadowTestEvaluator
 from integrations.trends import InstagramHashtagScraperAdapter, RedditTrendsAdapter, TrendAggregator
 
@@ -64,6 +64,12 @@ def test_schema_validation_rejects_invalid_uri() -> None:
         assert "invalid uri format" in str(exc)
 
 
+def test_schema_validator_is_compiled_once_per_schema_path() -> None:
+    validator = compile_validator("schemas/published_post.schema.json")
+    assert compile_validator("schemas/published_post.schema.json") is validator
+    assert compile_validator("contracts/script_package.schema.json") is not validator
+
+
 def test_adaptive_cycle_emits_mode_shadow_and_monetization_updates() -> None:
     optimization = OptimizationConfig()
     records = []
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 
 pytest.importorskip("sqlalchemy")
 
+from sqlalchemy import event, select, text
+
 from instagram_ai_system import CreativityMode, PageStrategyConfig, PublishedPostMetrics, ReelSignal
 from instagram_ai_system.orchestration import InstagramAISystem
 from instagram_ai_system.storage import (
@@ -13,12 +17,14 @@ from instagram_ai_system.storage import (
     BriefAssetRepository,
     ContentPlanRepository,
     Database,
+    DecisionLogRepository,
     ExperimentStateRepository,
     PerformanceSnapshotRepository,
     PublishAttemptRepository,
     OperationRunRepository,
     NicheStrategyRepository,
 )
+from instagram_ai_system.storage.models import ContentPlanModel
 
 
 def test_repositories_round_trip_records() -> None:
@@ -169,6 +175,40 @@ def test_operation_run_repository_tracks_failed_and_replayed_state() -> None:
         assert len(failed) == 1
         assert failed[0].id == "run-1"
         assert repo.was_replayed(failed_run_id="run-1") is True
+        assert repo.was_replayed(failed_run_id="run-2") is False
+        assert repo.replayed_failed_run_ids(["run-1", "run-2"]) == {"run-1"}
+        assert repo.replayed_failed_run_ids([]) == set()
+        assert repo.replayed_failed_run_ids(f"run-{i}" for i in range(1200)) == {"run-1"}
+
+
+def test_complete_run_updates_pending_and_persisted_runs() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    now = datetime.utcnow()
+
+    with db.session_scope() as session:
+        repo = OperationRunRepository(session)
+        repo.create_run(
+            run_id="run-1",
+            operation_name="publish",
+            params_payload={},
+            status="running",
+            result_payload={},
+            trace_id="trace-1",
+            started_at=now,
+        )
+        completed = repo.complete_run(run_id="run-1", status="succeeded", result_payload={"ok": True}, completed_at=now)
+        assert completed.status == "succeeded"
+        assert completed.result_payload == {"ok": True}
+
+    with db.session_scope() as session:
+        repo = OperationRunRepository(session)
+        failed = repo.complete_run(
+            run_id="run-1", status="failed", result_payload={}, completed_at=now, error_message="boom"
+        )
+        assert failed.error_message == "boom"
+        with pytest.raises(ValueError, match="Unknown operation run id"):
+            repo.complete_run(run_id="missing", status="failed", result_payload={}, completed_at=now)
 
 
 def test_niche_strategy_repository_persists_strategy_records() -> None:
@@ -234,3 +274,389 @@ def test_niche_strategy_repository_persists_strategy_records() -> None:
         ranked = NicheStrategyRepository(session).list_ranked_niches()
         assert len(ranked) == 1
         assert ranked[0].success_score == pytest.approx(0.74)
+        assert NicheStrategyRepository(session).list_ranked_niches(jit_min_rows=1) == ranked
+
+
+class _EstimateSession:
+    def __init__(self, dialect_name: str, estimate: float | None):
+        self.dialect_name = dialect_name
+        self.estimate = estimate
+        self.queries: list[str] = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name=self.dialect_name))
+
+    def scalar(self, statement, params=None):
+        self.queries.append(str(statement))
+        return self.estimate
+
+
+def test_estimated_niche_rows_reads_planner_estimate_on_postgres_only() -> None:
+    assert NicheStrategyRepository(_EstimateSession("postgresql", 5000.0))._estimated_niche_rows_at_least(1000)
+    assert not NicheStrategyRepository(_EstimateSession("postgresql", 10.0))._estimated_niche_rows_at_least(1000)
+    assert not NicheStrategyRepository(_EstimateSession("postgresql", None))._estimated_niche_rows_at_least(1)
+
+    sqlite_session = _EstimateSession("sqlite", 5000.0)
+    assert not NicheStrategyRepository(sqlite_session)._estimated_niche_rows_at_least(1)
+    assert sqlite_session.queries == []
+
+
+def test_list_ranked_niches_skips_jit_settings_on_sqlite() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    statements: list[str] = []
+    event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    with db.session_scope() as session:
+        assert NicheStrategyRepository(session).list_ranked_niches(jit_min_rows=0) == []
+
+    assert not [statement for statement in statements if "jit" in statement.lower()]
+
+
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL not set")
+def test_list_ranked_niches_scopes_jit_to_the_query_on_postgres() -> None:
+    db = Database(os.environ["TEST_POSTGRES_URL"])
+    Base.metadata.create_all(db.engine)
+
+    with db.session_scope() as session:
+        NicheStrategyRepository(session).list_ranked_niches(jit_min_rows=0)
+        assert session.scalar(text("SHOW jit_above_cost")) != "0"
+
+
+def test_bulk_inserts_append_only_rows() -> None:
+    from instagram_ai_system.storage.models import DecisionLogModel
+
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    now = datetime.utcnow()
+
+    with db.session_scope() as session:
+        inserted = PerformanceSnapshotRepository(session).record_snapshots(
+            [
+                {
+                    "id": f"snap-{i}",
+                    "publish_attempt_id": "attempt-1",
+                    "metrics_payload": {"views": 100 * i},
+                    "derived_rates": {},
+                    "captured_at": now,
+                    "trace_id": "trace-bulk",
+                }
+                for i in range(3)
+            ]
+        )
+        assert inserted == 3
+        assert PerformanceSnapshotRepository(session).record_snapshots([]) == 0
+
+    with db.session_scope() as session:
+        assert (
+            DecisionLogRepository(session).create_many(
+                [
+                    {
+                        "id": "d-1",
+                        "run_id": "run-1",
+                        "decision_type": "mode",
+                        "decision_payload": {},
+                        "trace_id": "trace-bulk",
+                    }
+                ]
+            )
+            == 1
+        )
+
+    with db.session_scope() as session:
+        snapshots = PerformanceSnapshotRepository(session).list_for_attempt("attempt-1")
+        assert len(snapshots) == 3
+        assert {snap.window for snap in snapshots} == {"24h"}
+        assert all(snap.created_at is not None for snap in snapshots)
+        projected = PerformanceSnapshotRepository(session).list_for_attempt_projected(
+            "attempt-1", ["id", "metrics_payload"]
+        )
+        assert sorted((row["id"], row["metrics_payload"]["views"]) for row in projected) == [
+            ("snap-0", 0),
+            ("snap-1", 100),
+            ("snap-2", 200),
+        ]
+        assert session.get(DecisionLogModel, "d-1") is not None
+
+
+def test_json_columns_round_trip_like_stdlib_json() -> None:
+    from instagram_ai_system.storage.models import DecisionLogModel
+
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    payload = {"scores": [0.5, 1], "by_rank": {1: "a"}, "label": "caf\u00e9"}
+
+    with db.session_scope() as session:
+        DecisionLogRepository(session).create_many(
+            [{"id": "d-1", "run_id": "run-1", "decision_type": "mode", "decision_payload": payload, "trace_id": "t"}]
+        )
+
+    with db.session_scope() as session:
+        stored = session.get(DecisionLogModel, "d-1").decision_payload
+    assert stored == {"scores": [0.5, 1], "by_rank": {"1": "a"}, "label": "caf\u00e9"}
+
+
+def test_upsert_arm_states_inserts_and_updates_in_bulk() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+
+    with db.session_scope() as session:
+        repo = ExperimentStateRepository(session)
+        repo.upsert_arm_states(
+            [
+                repo.build_arm_state_record(arm_key="a", pulls=1, reward_sum=0.5, schema_version="1.0", trace_id="t1"),
+                repo.build_arm_state_record(arm_key="b", pulls=2, reward_sum=1.0, schema_version="1.0", trace_id="t1"),
+            ],
+            schema_version="1.0",
+            trace_id="t1",
+        )
+        loaded = {state.arm_key: state for state in repo.load_arm_states()}
+        assert loaded["b"].pulls == 2
+
+        repo.upsert_arm_states(
+            [repo.build_arm_state_record(arm_key="b", pulls=5, reward_sum=3.0, schema_version="1.0", trace_id="t2")],
+            schema_version="1.1",
+            trace_id="t2",
+        )
+        refreshed = {state.arm_key: state for state in repo.load_arm_states()}
+        assert refreshed["a"].pulls == 1
+        assert refreshed["b"].pulls == 5
+        assert refreshed["b"].schema_version == "1.1"
+        assert refreshed["b"].trace_id == "t2"
+
+
+def test_upsert_arm_states_keeps_last_entry_for_duplicate_keys() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+
+    with db.session_scope() as session:
+        repo = ExperimentStateRepository(session)
+        repo.upsert_arm_states(
+            [
+                repo.build_arm_state_record(arm_key="a", pulls=1, reward_sum=0.5, schema_version="1.0", trace_id="t1"),
+                repo.build_arm_state_record(arm_key="a", pulls=3, reward_sum=2.0, schema_version="1.0", trace_id="t1"),
+            ],
+            schema_version="1.0",
+            trace_id="t1",
+        )
+        loaded = repo.load_arm_states()
+        assert [(state.arm_key, state.pulls, state.reward_sum) for state in loaded] == [("a", 3, 2.0)]
+
+
+def test_upsert_plans_inserts_and_updates_in_one_statement() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+
+    def _plan(plan_id: str, status: str) -> dict:
+        return {
+            "plan_id": plan_id,
+            "topic": "topic",
+            "objective": "reach",
+            "status": status,
+            "payload": {"id": plan_id},
+            "schema_version": "1.0",
+            "trace_id": "t1",
+        }
+
+    with db.session_scope() as session:
+        repo = ContentPlanRepository(session)
+        created = repo.upsert_plans([_plan("p1", "draft"), _plan("p2", "draft")])
+        assert [plan.id for plan in created] == ["p1", "p2"]
+
+        updated = repo.upsert_plans([_plan("p2", "approved"), _plan("p3", "draft")])
+        assert [plan.status for plan in updated] == ["approved", "draft"]
+        plan = repo.upsert_plan(
+            plan_id="p1",
+            topic="new",
+            objective="reach",
+            status="approved",
+            payload={},
+            schema_version="1.1",
+            trace_id="t2",
+        )
+        assert plan.topic == "new"
+
+    with db.session_scope() as session:
+        plans = {plan.id: plan for plan in session.scalars(select(ContentPlanModel))}
+        assert set(plans) == {"p1", "p2", "p3"}
+        assert plans["p1"].schema_version == "1.1"
+        assert plans["p2"].status == "approved"
+
+
+def test_bulk_record_methods_insert_rows_in_one_batch() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    now = datetime.utcnow()
+
+    with db.session_scope() as session:
+        assert (
+            BriefAssetRepository(session).create_brief_assets(
+                [
+                    {"id": "asset-1", "content_plan_id": "plan-1", "lifecycle_state": "draft", "trace_id": "t"},
+                    {"id": "asset-2", "content_plan_id": "plan-1", "lifecycle_state": "draft", "trace_id": "t"},
+                ]
+            )
+            == 2
+        )
+        assert (
+            PublishAttemptRepository(session).create_attempts(
+                [
+                    {
+                        "id": f"attempt-{i}",
+                        "brief_asset_id": "asset-1",
+                        "platform": "instagram",
+                        "status": "success",
+                        "attempted_at": now,
+                        "trace_id": "t",
+                    }
+                    for i in range(4)
+                ]
+            )
+            == 4
+        )
+        assert (
+            NicheStrategyRepository(session).record_experiment_metrics(
+                [{"id": "em-1", "experiment_post_id": "ep-1", "metric_payload": {"views": 10}, "captured_at": now, "trace_id": "t"}]
+            )
+            == 1
+        )
+
+    with db.session_scope() as session:
+        assert len(BriefAssetRepository(session).list_for_plan("plan-1")) == 2
+        attempts = PublishAttemptRepository(session).list_for_asset("asset-1")
+        assert len(attempts) == 4
+        assert {attempt.attempt_number for attempt in attempts} == {1}
+
+
+def test_aggregate_by_attempt_sums_metrics_in_sql_with_fallback_keys() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    now = datetime.utcnow()
+    payloads = [
+        ("a1", "24h", {"reach": 100, "shares": 2, "saves": 1, "watch_through": 0.5}),
+        ("a1", "24h", {"views": 50, "retention": 0.3}),
+        ("a2", "24h", {"reach": 10}),
+        ("a2", "7d", {"reach": 999}),
+    ]
+
+    with db.session_scope() as session:
+        repo = PerformanceSnapshotRepository(session)
+        repo.record_snapshots(
+            [
+                {
+                    "id": f"snap-{i}",
+                    "publish_attempt_id": attempt_id,
+                    "window": window,
+                    "metrics_payload": payload,
+                    "derived_rates": {},
+                    "captured_at": now,
+                    "trace_id": "t",
+                }
+                for i, (attempt_id, window, payload) in enumerate(payloads)
+            ]
+        )
+
+        rows = repo.aggregate_by_attempt(since=now - timedelta(hours=1), window="24h")
+        by_attempt = {row[0]: tuple(row[1:]) for row in rows}
+        assert by_attempt["a1"] == pytest.approx((150, 2, 1, 0.8, 2))
+        assert by_attempt["a2"] == pytest.approx((10, 0, 0, 0.0, 1))
+
+
+def test_create_run_flush_fetches_server_defaults_in_the_insert() -> None:
+    from sqlalchemy import event
+
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    statements: list[str] = []
+    event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt))
+
+    with db.session_scope() as session:
+        run = OperationRunRepository(session).create_run(
+            run_id="run-returning",
+            operation_name="health-check",
+            params_payload={},
+            status="running",
+            result_payload={},
+            trace_id="trace-r",
+            started_at=datetime.utcnow(),
+        )
+        session.flush()
+        flushed = list(statements)
+
+    assert len(flushed) == 1
+    assert flushed[0].startswith("INSERT INTO operation_runs")
+    assert "RETURNING" in flushed[0]
+    assert run.created_at is not None
+    assert run.updated_at is not None
+
+
+def test_list_for_plan_deep_prefetches_attempts_and_snapshots() -> None:
+    from sqlalchemy import event
+
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    now = datetime.utcnow()
+
+    with db.session_scope() as session:
+        BriefAssetRepository(session).create_brief_assets(
+            [
+                {"id": f"asset-{i}", "content_plan_id": "plan-1", "lifecycle_state": "approved", "trace_id": "t"}
+                for i in range(3)
+            ]
+        )
+        PublishAttemptRepository(session).create_attempts(
+            [
+                {
+                    "id": f"attempt-{i}",
+                    "brief_asset_id": f"asset-{i}",
+                    "platform": "instagram",
+                    "status": "success",
+                    "attempted_at": now,
+                    "trace_id": "t",
+                }
+                for i in range(3)
+            ]
+        )
+        PerformanceSnapshotRepository(session).record_snapshots(
+            [
+                {"id": f"snap-{i}", "publish_attempt_id": f"attempt-{i % 3}", "captured_at": now, "trace_id": "t"}
+                for i in range(6)
+            ]
+        )
+
+    statements: list[str] = []
+    event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt))
+    with db.session_scope() as session:
+        assets = BriefAssetRepository(session).list_for_plan_deep("plan-1")
+        page = BriefAssetRepository(session).list_for_plan_deep("plan-1", limit=1, offset=1)
+
+    assert [asset.id for asset in assets] == ["asset-0", "asset-1", "asset-2"]
+    assert [asset.id for asset in page] == ["asset-1"]
+    assert all(len(asset.publish_attempts) == 1 for asset in assets)
+    assert sum(len(attempt.snapshots) for asset in assets for attempt in asset.publish_attempts) == 6
+    assert len([stmt for stmt in statements if stmt.startswith("SELECT")]) == 6
+
+
+def test_iter_failed_runs_streams_in_batches() -> None:
+    db = Database("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(db.engine)
+    now = datetime.utcnow()
+
+    with db.session_scope() as session:
+        repo = OperationRunRepository(session)
+        for i in range(5):
+            repo.create_run(
+                run_id=f"run-{i}",
+                operation_name="publish",
+                params_payload={},
+                status="failed",
+                result_payload={},
+                trace_id="trace-stream",
+                started_at=now,
+            )
+
+    with db.session_scope() as session:
+        streamed = OperationRunRepository(session).iter_failed_runs(
+            operation_name="publish", since=datetime(2000, 1, 1), batch_size=2
+        )
+        assert sorted(run.id for run in streamed) == [f"run-{i}" for i in range(5)]